@@ -0,0 +1,43 @@
+from timeit import default_timer
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+from mplex import Grid
+from mplex.axes_collection import PerAxes
+
+SHAPES = {10: (1, 10), 100: (10, 10), 1000: (25, 40)}
+
+
+class AxArrayBroadcast:
+    params = list(SHAPES)
+    param_names = ["n_axes"]
+    timeout = 300
+
+    def setup(self, n_axes):
+        shape = SHAPES[n_axes]
+        self.g = Grid(10, shape, sharex=False, sharey=False)
+        self.xlims = np.stack(np.broadcast_arrays(0, np.arange(n_axes) + 1), -1)
+        self.xlims = self.xlims.reshape((*shape, 2))
+
+    def teardown(self, n_axes):
+        plt.close(self.g.fig)
+
+    def time_getattr(self, n_axes):
+        self.g.get_xlim()
+
+    def time_call(self, n_axes):
+        self.g.set_xlim(0, 1)
+
+    def time_call_no_collect(self, n_axes):
+        self.g.broadcast("set_xlim", 0, 1, collect=False)
+
+    def time_call_per_axes_args(self, n_axes):
+        self.g.set_xlim(PerAxes(self.xlims))
+
+    def track_call_per_axes(self, n_axes):
+        t = default_timer()
+        self.g.broadcast("set_xlim", 0, 1, collect=False)
+        return (default_timer() - t) / n_axes
+
+    track_call_per_axes.unit = "seconds"
@@ -0,0 +1,40 @@
+from mplex import cm
+
+
+class ColormapDerivation:
+    params = [256, 1024]
+    param_names = ["lut"]
+
+    def setup(self, lut):
+        cm.disable_cache()
+
+    def teardown(self, lut):
+        cm.disable_cache()
+
+    def time_map_cmap(self, lut):
+        cm.map_cmap(lambda c: c[..., ::-1], "viridis", lut, vectorized=True)
+
+    def time_get_transparent_cmap(self, lut):
+        cm.get_transparent_cmap("viridis", "w", lut)
+
+    def time_interp_colors_lab(self, lut):
+        cm.interp_colors(["k", "r", "y", "w"], lut, color_space="lab")
+
+    def time_interp_colors_luv(self, lut):
+        cm.interp_colors(["k", "r", "y", "w"], lut, color_space="luv")
+
+    def peakmem_interp_colors(self, lut):
+        cm.interp_colors(["k", "r", "y", "w"], lut)
+
+
+class ColormapCache:
+    def setup(self):
+        cm.enable_cache()
+        cm.clear_cache()
+        cm.get_transparent_cmap("viridis", "w")
+
+    def teardown(self):
+        cm.disable_cache()
+
+    def time_cached_get_transparent_cmap(self):
+        cm.get_transparent_cmap("viridis", "w")
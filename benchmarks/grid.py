@@ -0,0 +1,85 @@
+import io
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+from mplex import Grid
+
+SHAPES = {1: (1, 1), 10: (2, 5), 100: (10, 10), 400: (20, 20)}
+
+
+class GridConstruction:
+    params = (list(SHAPES), [False, True])
+    param_names = ["n_axes", "lazy"]
+    timeout = 300
+
+    def teardown(self, n_axes, lazy):
+        plt.close("all")
+
+    def time_grid(self, n_axes, lazy):
+        Grid(10, SHAPES[n_axes], lazy=lazy)
+
+    def peakmem_grid(self, n_axes, lazy):
+        Grid(10, SHAPES[n_axes], lazy=lazy)
+
+
+def _plot(g):
+    x = np.linspace(0, 1, 100)
+    g.plot(x, np.sin(x * 6))
+
+
+class Savefig:
+    params = (list(SHAPES), ["png", "svg", "pdf"])
+    param_names = ["n_axes", "format"]
+    timeout = 300
+
+    def setup(self, n_axes, fmt):
+        self.g = Grid(20, SHAPES[n_axes])
+        _plot(self.g)
+        self.buf = io.BytesIO()
+
+    def teardown(self, n_axes, fmt):
+        plt.close("all")
+
+    def time_savefig(self, n_axes, fmt):
+        self.g.savefig(self.buf, format=fmt)
+
+    def peakmem_savefig(self, n_axes, fmt):
+        self.g.savefig(self.buf, format=fmt)
+
+
+class ToRgbaArray:
+    params = (list(SHAPES), ["rgba", "rgb", "gray"])
+    param_names = ["n_axes", "mode"]
+    timeout = 300
+
+    def setup(self, n_axes, mode):
+        self.g = Grid(20, SHAPES[n_axes])
+        _plot(self.g)
+
+    def teardown(self, n_axes, mode):
+        plt.close("all")
+
+    def time_to_rgba_array(self, n_axes, mode):
+        self.g.to_rgba_array(mode=mode)
+
+    def peakmem_to_rgba_array(self, n_axes, mode):
+        self.g.to_rgba_array(mode=mode)
+
+
+class IncrementalToRgbaArray:
+    params = (list(SHAPES), [False, True])
+    param_names = ["n_axes", "incremental"]
+    timeout = 300
+
+    def setup(self, n_axes, incremental):
+        self.g = Grid(20, SHAPES[n_axes], sharex="n", sharey="n")
+        self.lines = [ax.plot(np.random.rand(100))[0] for ax in self.g.axs.flat]
+        self.g.to_rgba_array(incremental=incremental)
+
+    def teardown(self, n_axes, incremental):
+        plt.close("all")
+
+    def time_update_one_axes(self, n_axes, incremental):
+        self.lines[0].set_ydata(np.random.rand(100))
+        self.g.to_rgba_array(incremental=incremental)
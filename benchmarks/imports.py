@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+# measured on a laptop: matplotlib alone ~0.65 s, matplotlib.pyplot ~1.6 s;
+# `import mplex` should stay close to the former (see tests/test_imports.py)
+
+
+def timeraw_import_mplex():
+    return "import mplex"
+
+
+def timeraw_import_mplex_no_style():
+    return """
+    import os
+    os.environ["MPLEX_NO_STYLE"] = "1"
+    import mplex
+    """
+
+
+def timeraw_import_grid():
+    return "from mplex import Grid"
+
+
+def track_import_loads_pyplot():
+    code = "import sys, mplex; print(int('matplotlib.pyplot' in sys.modules))"
+    return int(subprocess.check_output([sys.executable, "-c", code]))
+
+
+track_import_loads_pyplot.unit = "bool"
@@ -0,0 +1,53 @@
+import numpy as np
+from matplotlib import pyplot as plt
+
+from mplex import Grid
+from mplex.plot import cplot, cplots
+
+
+class Cplot:
+    params = ([10**3, 10**5, 10**6], [False, True])
+    param_names = ["n_points", "lod"]
+    timeout = 300
+
+    def setup(self, n, lod):
+        self.ax = Grid(100).axs[0, 0]
+        self.x = np.linspace(0, 1, n)
+        self.y = np.random.default_rng(0).standard_normal(n).cumsum()
+
+    def teardown(self, n, lod):
+        plt.close("all")
+
+    # remove the collection so that repeated calls do not draw previous ones
+    def time_cplot(self, n, lod):
+        cplot(self.x, self.y, lod=lod, ax=self.ax).remove()
+
+    def time_cplot_draw(self, n, lod):
+        lc = cplot(self.x, self.y, lod=lod, ax=self.ax)
+        self.ax.figure.canvas.draw()
+        lc.remove()
+
+    def peakmem_cplot_draw(self, n, lod):
+        lc = cplot(self.x, self.y, lod=lod, ax=self.ax)
+        self.ax.figure.canvas.draw()
+        lc.remove()
+
+
+class Cplots:
+    params = [10, 100, 1000]
+    param_names = ["n_lines"]
+    timeout = 300
+
+    def setup(self, n_lines):
+        self.ax = Grid(100).axs[0, 0]
+        self.ys = np.random.default_rng(0).standard_normal((n_lines, 1000)).cumsum(1)
+        self.xs = np.broadcast_to(np.arange(1000.0), self.ys.shape)
+
+    def teardown(self, n_lines):
+        plt.close("all")
+
+    def time_cplots(self, n_lines):
+        cplots(self.xs, self.ys, ax=self.ax).remove()
+
+    def peakmem_cplots(self, n_lines):
+        cplots(self.xs, self.ys, ax=self.ax).remove()
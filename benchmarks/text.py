@@ -0,0 +1,30 @@
+from matplotlib import pyplot as plt
+
+from mplex import Grid
+from mplex.text import TextMetrics, get_text_bbox
+
+STRINGS = [f"{i / 7:.{i % 5}f}" for i in range(100)]
+
+
+class TextBbox:
+    def setup(self):
+        self.ax = Grid(100).axs[0, 0]
+        self.metrics = TextMetrics()
+
+    def teardown(self):
+        plt.close("all")
+
+    def time_get_text_bbox(self):
+        for s in STRINGS:
+            get_text_bbox(s, ax=self.ax)
+
+    def time_measure_cold(self):
+        self.metrics.clear()
+        self.metrics.measure(STRINGS)
+
+    def time_measure_warm(self):
+        self.metrics.measure(STRINGS)
+
+    def peakmem_get_text_bbox(self):
+        for s in STRINGS:
+            get_text_bbox(s, ax=self.ax)
@@ -1,4 +1,50 @@
-from mplex.grid import Grid  # noqa
+import os
+from importlib import import_module
+
 from mplex.style import use_style
 
-use_style()
+# loaded on first access to keep `import mplex` from importing pyplot
+_lazy_attrs = {"Grid": "mplex.grid"}
+_submodules = {
+    "animation",
+    "aio",
+    "annotate",
+    "artist",
+    "axes",
+    "axes_collection",
+    "batch",
+    "cm",
+    "colors",
+    "core",
+    "export",
+    "figure",
+    "grid",
+    "montage",
+    "plot",
+    "pool",
+    "profiling",
+    "raster",
+    "style",
+    "text",
+    "transforms",
+    "utils",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_attrs:
+        return getattr(import_module(_lazy_attrs[name]), name)
+
+    if name in _submodules:
+        return import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_attrs, *_submodules})
+
+
+# set MPLEX_NO_STYLE=1 to keep the Matplotlib defaults
+if not os.environ.get("MPLEX_NO_STYLE"):
+    use_style()
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+_executor = None
+_max_workers = None
+_max_pending = None
+_semaphores = weakref.WeakKeyDictionary()  # event loop -> Semaphore
+_lock = threading.Lock()
+
+
+def configure(max_workers=None, max_pending=None):
+    """Set the size of the executor shared by the async exports.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of threads. Defaults to ``min(4, os.cpu_count())``; more threads
+        do not help much as Matplotlib draws one figure at a time.
+    max_pending : int, optional
+        Maximum number of exports submitted per event loop, running or
+        queued. Further exports wait before being submitted, which bounds
+        memory use. Defaults to twice the number of threads.
+    """
+    global _executor, _max_workers, _max_pending
+
+    with _lock:
+        executor, _executor = _executor, None
+        _max_workers, _max_pending = max_workers, max_pending
+        _semaphores.clear()
+
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def _get_executor():
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                _max_workers or min(4, os.cpu_count() or 1),
+                thread_name_prefix="mplex",
+            )
+
+        return _executor
+
+
+def _get_semaphore(loop):
+    with _lock:
+        semaphore = _semaphores.get(loop)
+
+        if semaphore is None:
+            n = _max_pending or 2 * (_max_workers or min(4, os.cpu_count() or 1))
+            semaphore = _semaphores[loop] = asyncio.Semaphore(n)
+
+        return semaphore
+
+
+async def run(grid, func, *args, **kwargs):
+    """Call ``func(*args, **kwargs)`` in the executor, holding the grid lock.
+
+    Cancelling the awaiting task before the call starts (while waiting for a
+    slot, for a thread, or for another export of the same grid) skips it. A
+    call already running completes and its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    cancelled = threading.Event()
+
+    def call():
+        with grid._lock:
+            if cancelled.is_set():
+                return None
+
+            return func(*args, **kwargs)
+
+    async with _get_semaphore(loop):
+        try:
+            return await loop.run_in_executor(_get_executor(), call)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+
+async def savefig(grid, fname, **kwargs):
+    """Await ``grid.savefig(fname, **kwargs)`` run in a thread.
+
+    The grid should be created with ``pyplot=False`` so that it has its own
+    Agg canvas. Exports of the same grid are serialized; exports of different
+    grids can run concurrently. rcParams must not be changed meanwhile.
+    """
+    return await run(grid, grid.savefig, fname, **kwargs)
+
+
+async def to_rgba_array(grid, out=None, mode="rgba", dtype=np.uint8, **kwargs):
+    """Await ``grid.to_rgba_array`` run in a thread.
+
+    Unlike the synchronous method, a copy of the canvas buffer is returned,
+    since the next draw would overwrite it.
+    """
+
+    def export():
+        img = grid.to_rgba_array(out, mode, dtype, **kwargs)
+        return img if img.flags.writeable else img.copy()
+
+    return await run(grid, export)
@@ -0,0 +1,125 @@
+from typing import Callable, Iterable
+
+from matplotlib.artist import Artist
+from matplotlib.figure import Figure
+
+from mplex.raster import get_rgba_buffer
+
+
+def iter_frames(
+    fig: Figure,
+    update: Callable,
+    frames: Iterable,
+    artists: Iterable[Artist] = (),
+    copy=True,
+):
+    """Render frames by blitting only the axes that changed.
+
+    The figure is drawn once without ``artists``, and the background of each
+    axes is cached. For every frame, ``update(frame)`` is called and should
+    return the artists it changed (or None to redraw all ``artists``). Only
+    the axes containing those artists are restored and redrawn. Animated
+    artists should be clipped to their axes.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure with an Agg canvas.
+    update : callable
+        Function called with each frame.
+    frames : iterable
+        Values passed to ``update``.
+    artists : iterable of Artist
+        All artists that may change across frames.
+    copy : bool
+        If False, yield a read-only view of the canvas buffer, which is only
+        valid until the next frame is requested.
+
+    Yields
+    ------
+    np.ndarray
+        uint8 RGBA frame of shape (height, width, 4).
+    """
+    artists = list(artists)
+    animated = [a.get_animated() for a in artists]
+    axes_artists = {}
+
+    for a in artists:
+        a.set_animated(True)
+        axes_artists.setdefault(a.axes, []).append(a)
+
+    for ax_artists in axes_artists.values():
+        ax_artists.sort(key=Artist.get_zorder)
+
+    canvas = fig.canvas
+
+    try:
+        canvas.draw()
+        renderer = canvas.get_renderer()
+        backgrounds = {ax: canvas.copy_from_bbox(ax.bbox) for ax in axes_artists}
+
+        for ax_artists in axes_artists.values():
+            for a in ax_artists:
+                a.draw(renderer)
+
+        for frame in frames:
+            changed = update(frame)
+            dirty = (
+                axes_artists.keys() if changed is None else {a.axes for a in changed}
+            )
+
+            if not dirty <= backgrounds.keys():
+                raise ValueError("update changed an artist not in artists")
+
+            for ax in dirty:
+                canvas.restore_region(backgrounds[ax])
+
+                for a in axes_artists[ax]:
+                    a.draw(renderer)
+
+            img = get_rgba_buffer(canvas, draw=False)
+            yield img.copy() if copy else img
+    finally:
+        for a, b in zip(artists, animated):
+            a.set_animated(b)
+
+
+def pipe_frames(
+    fig: Figure,
+    cmd,
+    update: Callable,
+    frames: Iterable,
+    artists: Iterable[Artist] = (),
+):
+    """Write raw RGBA frames from ``iter_frames`` to the stdin of ``cmd``.
+
+    See ``get_ffmpeg_cmd`` for a suitable encoder command.
+    """
+    import subprocess
+
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    try:
+        for img in iter_frames(fig, update, frames, artists, copy=False):
+            proc.stdin.write(img.data)
+    finally:
+        proc.stdin.close()
+        proc.wait()
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def get_ffmpeg_cmd(path, fig: Figure, fps=30, codec="libx264", extra_args=()):
+    w, h = fig.canvas.get_width_height(physical=True)
+
+    return [
+        "ffmpeg",
+        "-y",
+        "-loglevel",
+        "error",
+        *("-f", "rawvideo", "-pix_fmt", "rgba"),
+        *("-s", f"{w}x{h}", "-r", str(fps), "-i", "-"),
+        *("-c:v", codec, "-pix_fmt", "yuv420p", *extra_args),
+        str(path),
+    ]
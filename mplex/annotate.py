@@ -1,9 +1,10 @@
-import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.transforms import IdentityTransform
 
 from mplex.transforms import get_shifted_trans_axes
-from mplex.utils import safe_unpack
+from mplex.utils import convert_unit, safe_unpack
 
 
 def add_bar(axs: np.ndarray, fro=0, to=-1, side="t", pad=0, **kwargs):
@@ -51,6 +52,125 @@ def add_line_across_axes(
     return ax1.add_artist(ConnectionPatch(p1, p2, trans1, trans2, **kwargs))
 
 
+class _AcrossAxesLineCollection(LineCollection):
+    """Lines between points in axes coordinates of different axes.
+
+    Segments are computed in display coordinates from the bounding boxes of
+    the axes whenever the collection is drawn or measured.
+    """
+
+    def __init__(self, axs, i1, p1, i2, p2, pad1, pad2, **kwargs):
+        self._axs = axs
+        self._ends = i1, p1, i2, p2, pad1, pad2  # pads in inches
+        super().__init__([], transform=IdentityTransform(), **kwargs)
+
+    def _update_segments(self):
+        i1, p1, i2, p2, pad1, pad2 = self._ends
+        bounds = np.array([ax.bbox.bounds for ax in self._axs]).reshape(-1, 2, 2)
+        dpi = self.figure.dpi
+        xy1 = bounds[i1, 0] + p1 * bounds[i1, 1] + pad1 * dpi
+        xy2 = bounds[i2, 0] + p2 * bounds[i2, 1] + pad2 * dpi
+        self.set_segments(np.stack([xy1, xy2], 1))
+
+    def get_window_extent(self, renderer=None):
+        self._update_segments()
+        return super().get_window_extent(renderer)
+
+    def draw(self, renderer):
+        self._update_segments()
+        super().draw(renderer)
+
+
+def add_lines_across_axes(
+    ax1, p1, ax2, p2, xpad=0, ypad=0, unit="pt", **kwargs
+) -> LineCollection:
+    """Add many lines between axes as a single figure-level collection.
+
+    Unlike ``add_line_across_axes``, whose lines are drawn with their first
+    axes (under the axes drawn later), the collection is drawn after all axes,
+    on top of their ticks. Pass ``zorder=-1`` to draw it before all axes,
+    which gives the same layering when the axes background is transparent
+    (the mplex default).
+
+    Parameters
+    ----------
+    ax1, ax2 : Axes or sequence of Axes
+        Axes of the start and end points of each line.
+    p1, p2 : array-like of shape (2,) or (n, 2)
+        Start and end points in axes coordinates.
+    xpad, ypad : array-like
+        Offsets broadcast to shape (n, 2), i.e. (line, end).
+    unit : str
+        Unit of the offsets.
+    **kwargs
+        Passed to ``LineCollection``, e.g. per-line ``colors``.
+    """
+    ax1 = np.atleast_1d(np.asarray(ax1, object))
+    ax2 = np.atleast_1d(np.asarray(ax2, object))
+    p1 = np.atleast_2d(np.asarray(p1, float))
+    p2 = np.atleast_2d(np.asarray(p2, float))
+    n = max(len(ax1), len(ax2), len(p1), len(p2))
+    ax1, ax2 = np.broadcast_to(ax1, n), np.broadcast_to(ax2, n)
+    p1, p2 = np.broadcast_to(p1, (n, 2)), np.broadcast_to(p2, (n, 2))
+
+    axs = list(dict.fromkeys([*ax1, *ax2]))
+    index = {ax: i for i, ax in enumerate(axs)}
+    i1 = np.fromiter(map(index.get, ax1), int, n)
+    i2 = np.fromiter(map(index.get, ax2), int, n)
+
+    xpad = convert_unit(np.broadcast_to(np.asarray(xpad, float), (n, 2)), unit, "in")
+    ypad = convert_unit(np.broadcast_to(np.asarray(ypad, float), (n, 2)), unit, "in")
+    pad1 = np.column_stack([xpad[:, 0], ypad[:, 0]])
+    pad2 = np.column_stack([xpad[:, 1], ypad[:, 1]])
+
+    # look like the ConnectionPatch of add_line_across_axes
+    kwargs = dict(dict(snap=False, capstyle="round"), **kwargs)
+    fig = axs[0].figure
+    lc = _AcrossAxesLineCollection(axs, i1, p1, i2, p2, pad1, pad2, **kwargs)
+    return fig.add_artist(lc)
+
+
+def add_bars(axs: np.ndarray, fro=0, to=-1, side="t", pad=0, **kwargs):
+    """Like ``add_bar`` for many bars at once, drawn as one collection.
+
+    ``fro`` and ``to`` are broadcast against each other, one bar per pair and
+    side. Returns the ``LineCollection``, which is drawn on top of all axes
+    (see ``add_lines_across_axes``).
+    """
+    axs = np.asarray(axs, object)
+    fro, to = np.broadcast_arrays(np.atleast_1d(fro), np.atleast_1d(to))
+    side = side.lower()
+    ones = np.ones(len(fro))
+    ax1, ax2, p1, p2, xpad, ypad = [], [], [], [], [], []
+
+    ends = dict(
+        t=(lambda i: axs[0, i], (0, 1), (1, 1), (0, pad)),
+        b=(lambda i: axs[-1, i], (0, 0), (1, 0), (0, -pad)),
+        l=(lambda i: axs[i, 0], (0, 1), (0, 0), (-pad, 0)),
+        r=(lambda i: axs[i, -1], (1, 1), (1, 0), (pad, 0)),
+    )
+
+    for s in "tblr":
+        if s in side:
+            get_axs, q1, q2, d = ends[s]
+            ax1.append(get_axs(fro))
+            ax2.append(get_axs(to))
+            p1.append(np.outer(ones, q1))
+            p2.append(np.outer(ones, q2))
+            xpad.append(ones * d[0])
+            ypad.append(ones * d[1])
+
+    return add_lines_across_axes(
+        np.concatenate(ax1),
+        np.concatenate(p1),
+        np.concatenate(ax2),
+        np.concatenate(p2),
+        np.concatenate(xpad)[:, None],
+        np.concatenate(ypad)[:, None],
+        **kwargs,
+    )
+
+
 def add_scale_bars(
     x0,
     y0,
@@ -70,6 +190,8 @@ def add_scale_bars(
     ax=None,
 ):
     if ax is None:
+        import matplotlib.pyplot as plt
+
         ax = plt.gca()
 
     line_kw_default = dict(clip_on=False)
@@ -1,13 +1,29 @@
+from copy import copy
 from typing import Tuple, Union
 
-import matplotlib.pyplot as plt
+import matplotlib
 import numpy as np
+from matplotlib.axes import Axes as MplAxes
+from matplotlib.figure import Figure as MplFigure
 
 from mplex import core, utils
 from mplex.utils import convert_unit
 
 
-class Axes(plt.Axes):
+class Axes(MplAxes):
+    _tight_bounds = None
+    _cache_ticks = False
+
+    def draw(self, renderer):
+        if self._cache_ticks:
+            for axis in (self.xaxis, self.yaxis):
+                _install_tick_cache(axis)
+
+        if self._tight_bounds is not None:
+            _set_tight_bounds(*self._tight_bounds, ax=self)
+
+        super().draw(renderer)
+
     def add_text(
         self,
         x,
@@ -117,8 +133,8 @@ class Axes(plt.Axes):
     def set_tick_direction(self, directions: str):
         return set_tick_direction(directions, ax=self)
 
-    def set_tight_bounds(self, x=True, y=True):
-        return set_tight_bounds(x, y, ax=self)
+    def set_tight_bounds(self, x=True, y=True, deferred=False):
+        return set_tight_bounds(x, y, deferred, ax=self)
 
     def remove_ticklabels_trailing_zeros(self, which="both"):
         return remove_ticklabels_trailing_zeros(which, ax=self)
@@ -131,41 +147,164 @@ class Axes(plt.Axes):
         )
 
 
-def set_tick_direction(directions: str, ax: plt.Axes):
+def get_tick_direction_kw(directions: str):
+    """Resolve ``set_tick_direction`` into tick params for the x and y axis."""
     direction_dict = {"i": "in", "o": "out", "b": "inout"}
 
     if len(directions) == 1:
         directions = directions * 2
 
+    kw = dict(x={}, y={})
+
     for i, direction in zip("xy", directions):
         if direction.lower() == "n":
-            ax.tick_params(i, length=0)
+            kw[i]["length"] = 0
         elif direction in direction_dict:
-            direction = direction_dict[direction]
-            ax.tick_params(i, direction=direction)
+            kw[i]["direction"] = direction_dict[direction]
+
+    return kw
+
+
+def set_tick_direction(directions: str, ax: MplAxes):
+    for i, kw in get_tick_direction_kw(directions).items():
+        if kw:
+            ax.tick_params(i, **kw)
+
+
+def _get_params_key(obj, exclude=("axis",)):
+    """Snapshot of the attributes of a locator or formatter, for comparison."""
+    return [
+        (k, v.tobytes() if isinstance(v, np.ndarray) else copy(v))
+        for k, v in vars(obj).items()
+        if k not in exclude
+    ]
+
+
+class _CachedTickLocs:
+    """Replacement of ``Axis.get_majorticklocs`` caching the locator result.
+
+    The locator of shared axes computes ticks from the axis it is attached
+    to, so the result is the same for the whole share group. Shared axes also
+    share their Ticker, on which the result is stored.
+    """
+
+    def __init__(self, axis):
+        self.axis = axis
+
+    def __call__(self):
+        axis = self.axis
+        locator = axis.get_major_locator()
+        owner = axis if locator.axis is None else locator.axis
+        key = (
+            locator,
+            _get_params_key(locator),
+            *owner.get_view_interval(),
+            *owner.get_data_interval(),
+            owner.get_scale(),
+            owner.get_tick_space(),
+            *owner.axes.bbox.size,
+        )
+        cached = getattr(axis.major, "_mplex_tick_locs", None)
+
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        locs = locator()
+        axis.major._mplex_tick_locs = key, locs
+        return locs
+
+
+# rcParams read by formatters when formatting, not only when created
+_FORMATTER_RC_KEYS = (
+    "axes.unicode_minus",
+    "text.usetex",
+    *(k for k in matplotlib.rcParams if k.startswith("axes.formatter.")),
+)
+
+
+class _CachedFormatTicks:
+    """Replacement of ``Formatter.format_ticks`` caching the last labels."""
+
+    def __init__(self, formatter):
+        self.formatter = formatter
+        self.format_ticks = formatter.format_ticks
+        self.key = self.labels = None
+
+    def __call__(self, values):
+        axis = self.formatter.axis
+        view = None if axis is None else tuple(axis.get_view_interval())
+        # the state left by the last call only differs if parameters changed
+        params = _get_params_key(self.formatter, ("axis", "format_ticks"))
+        rc = [matplotlib.rcParams[k] for k in _FORMATTER_RC_KEYS]
+        key = np.asarray(values).tobytes(), view, rc, params
+
+        if key != self.key:
+            self.labels = self.format_ticks(values)
+            params = _get_params_key(self.formatter, ("axis", "format_ticks"))
+            self.key = key[:3] + (params,)
+
+        return self.labels
+
+
+def _install_tick_cache(axis):
+    if "get_majorticklocs" not in vars(axis):
+        axis.get_majorticklocs = _CachedTickLocs(axis)
 
+    formatter = axis.get_major_formatter()
 
-def set_tight_bounds(x=True, y=True, *, ax: plt.Axes):
-    a, b = ax.get_xlim()
+    if "format_ticks" not in vars(formatter):
+        formatter.format_ticks = _CachedFormatTicks(formatter)
 
-    if x:
-        ticks = ax.get_xticks()
-        a = ticks[ticks >= a].min()
-        b = ticks[ticks <= b].max()
 
-    ax.spines.bottom.set_bounds(a, b)
+def _get_tick_bounds(axis):
+    a, b = sorted(axis.get_view_interval())
+    locator = axis.get_major_locator()
+    key = (
+        a,
+        b,
+        locator,
+        _get_params_key(locator),
+        axis.get_scale(),
+        axis.get_tick_space(),
+        *axis.axes.bbox.size,
+    )
+    cached = getattr(axis.major, "_mplex_tick_bounds", None)
 
-    a, b = ax.get_ylim()
+    if cached is not None and cached[0] == key:
+        return cached[1]
 
-    if y:
-        ticks = ax.get_yticks()
-        a = ticks[ticks >= a].min()
-        b = ticks[ticks <= b].max()
+    ticks = axis.get_majorticklocs()
+    bounds = ticks[ticks >= a].min(), ticks[ticks <= b].max()
+    axis.major._mplex_tick_bounds = key, bounds
+    return bounds
 
-    ax.spines.left.set_bounds(a, b)
 
+def _set_tight_bounds(x=True, y=True, *, ax: MplAxes):
+    bounds = _get_tick_bounds(ax.xaxis) if x else ax.get_xlim()
+    ax.spines.bottom.set_bounds(*bounds)
+    bounds = _get_tick_bounds(ax.yaxis) if y else ax.get_ylim()
+    ax.spines.left.set_bounds(*bounds)
 
-def remove_ticklabels_trailing_zeros(which="both", *, ax: plt.Axes):
+
+def set_tight_bounds(x=True, y=True, deferred=False, *, ax: MplAxes):
+    """Limit the bottom and left spines to the outermost ticks.
+
+    Tick bounds are cached per share group until the limits, locator, scale
+    or size of the axes change. If ``deferred`` is True, the bounds are
+    computed at draw time (mplex Axes only) and follow later limit changes.
+    """
+    if deferred:
+        if not isinstance(ax, Axes):
+            raise ValueError("deferred tight bounds require an mplex Axes")
+
+        ax._tight_bounds = x, y
+        ax.stale = True
+    else:
+        ax._tight_bounds = None
+        _set_tight_bounds(x, y, ax=ax)
+
+
+def remove_ticklabels_trailing_zeros(which="both", *, ax: MplAxes):
     from matplotlib.ticker import FormatStrFormatter
 
     if which == "both":
@@ -177,22 +316,133 @@ def remove_ticklabels_trailing_zeros(which="both", *, ax: plt.Axes):
         ax.yaxis.set_major_formatter(FormatStrFormatter("%g"))
 
 
-def set_visible_sides(
-    sides=None, *, spines=None, ticks=None, ticklabels=None, ax: plt.Axes
-):
+def get_visible_sides_kw(sides=None, *, spines=None, ticks=None, ticklabels=None):
+    """Resolve ``set_visible_sides`` into spine visibilities and tick params.
+
+    Returns
+    -------
+    dict
+        Visibility of each spine to set.
+    dict
+        Keyword arguments of ``tick_params``.
+    """
     if sides is not None:
         spines = ticks = ticklabels = sides
 
     if ticklabels is None and ticks is not None:
         ticklabels = ticks
 
+    spines_kw, tick_kw = {}, {}
+
     for side in core.SIDE_NAMES:
         if spines is not None:
-            ax.spines[side].set_visible(side in core.get_side_names(spines))
+            spines_kw[side] = side in core.get_side_names(spines)
         if ticks is not None:
-            ax.tick_params(**{side: side in core.get_side_names(ticks)})
+            tick_kw[side] = side in core.get_side_names(ticks)
         if ticklabels is not None:
-            ax.tick_params(**{f"label{side}": side in core.get_side_names(ticklabels)})
+            tick_kw[f"label{side}"] = side in core.get_side_names(ticklabels)
+
+    return spines_kw, tick_kw
+
+
+def set_visible_sides(
+    sides=None, *, spines=None, ticks=None, ticklabels=None, ax: MplAxes
+):
+    spines_kw, tick_kw = get_visible_sides_kw(
+        sides, spines=spines, ticks=ticks, ticklabels=ticklabels
+    )
+
+    for side, visible in spines_kw.items():
+        ax.spines[side].set_visible(visible)
+
+    if tick_kw:
+        ax.tick_params(**tick_kw)
+
+
+_ALIGN_OFFSETS = dict(
+    left=0, bottom=0, baseline=0, center=0.5, center_baseline=0.5, right=1, top=1
+)
+
+
+def get_decoration_extents(*, ax: MplAxes):
+    """Estimate how far ticks, tick labels, axis labels and titles extend
+    beyond the sides of ``ax``, without drawing.
+
+    Text is measured with the cached ``mplex.text.measure``.
+
+    Returns
+    -------
+    np.ndarray
+        Extents beyond the left, right, bottom and top sides in points.
+    """
+    from mplex.text import measure
+
+    extents = dict.fromkeys(core.SIDE_NAMES, 0.0)
+
+    if not ax.get_visible() or not ax.axison:
+        return np.zeros(4)
+
+    length = ax.get_position().size * ax.figure.get_size_inches() * 72
+
+    for axis, sides, ends, dim in (
+        (ax.xaxis, ("bottom", "top"), ("left", "right"), 1),
+        (ax.yaxis, ("left", "right"), ("bottom", "top"), 0),
+    ):
+        tick = axis.get_major_ticks(1)[0]
+        padding = tick.get_tick_padding()
+        vmin, vmax = sorted(axis.get_view_interval())
+        locs = np.asarray(axis.get_majorticklocs())
+        labels = axis.get_major_formatter().format_ticks(locs)
+        tol = (vmax - vmin) * 1e-10
+        inview = (locs >= vmin - tol) & (locs <= vmax + tol)
+        labels = [s for s, v in zip(labels, inview) if v]
+
+        # positions of the labels along the axis, in points
+        t = axis.get_transform().transform(np.r_[vmin, vmax, locs[inview]])
+        pos = (t[2:] - t[0]) / (t[1] - t[0]) * length[1 - dim]
+
+        for side, line, label in zip(
+            sides, (tick.tick1line, tick.tick2line), (tick.label1, tick.label2)
+        ):
+            if line.get_visible():
+                extents[side] = max(extents[side], padding)
+
+            if label.get_visible() and labels:
+                size = measure(
+                    labels,
+                    72,
+                    fontproperties=label.get_fontproperties(),
+                    rotation=label.get_rotation(),
+                )
+                extents[side] = padding + tick.get_pad() + size[:, dim].max()
+
+                # labels at the ends may stick out along the axis
+                align = label.get_ha() if dim else label.get_va()
+                lo = pos - _ALIGN_OFFSETS.get(align, 0.5) * size[:, 1 - dim]
+                hi = lo + size[:, 1 - dim]
+                extents[ends[0]] = max(extents[ends[0]], -lo.min())
+                extents[ends[1]] = max(extents[ends[1]], hi.max() - length[1 - dim])
+
+        label = axis.label
+
+        if label.get_visible() and label.get_text():
+            size = measure(
+                [label.get_text()],
+                72,
+                fontproperties=label.get_fontproperties(),
+                rotation=label.get_rotation(),
+            )[0, dim]
+            extents[axis.get_label_position()] += axis.labelpad + size
+
+    titles = [ax.get_title(loc) for loc in ("left", "center", "right")]
+    titles = [s for s in titles if s]
+
+    if titles:
+        size = measure(titles, 72, fontproperties=ax.title.get_fontproperties())
+        pad = matplotlib.rcParams["axes.titlepad"]
+        extents["top"] = max(extents["top"], pad) + size[:, 1].max()
+
+    return np.array([extents[side] for side in core.SIDE_NAMES])
 
 
 def add_axes(
@@ -306,8 +556,8 @@ def add_axes(
     return new_ax
 
 
-def add_bounding_axes(*axs: plt.Axes):
-    fig: plt.Figure = next(iter(axs)).figure
+def add_bounding_axes(*axs: MplAxes):
+    fig: MplFigure = next(iter(axs)).figure
     assert all(ax.figure is fig for ax in axs)
     trans = fig.transFigure.inverted()
     points = [ax.get_window_extent().transformed(trans).get_points() for ax in axs]
@@ -317,14 +567,14 @@ def add_bounding_axes(*axs: plt.Axes):
     return ax
 
 
-def get_row_span(*axs: plt.Axes):
+def get_row_span(*axs: MplAxes):
     row_spans = [ax.get_subplotspec().rowspan for ax in axs]
     row0 = min(i.start for i in row_spans)
     row1 = max(i.stop for i in row_spans)
     return row0, row1
 
 
-def get_col_span(*axs: plt.Axes):
+def get_col_span(*axs: MplAxes):
     col_spans = [ax.get_subplotspec().colspan for ax in axs]
     col0 = min(i.start for i in col_spans)
     col1 = max(i.stop for i in col_spans)
@@ -1,11 +1,15 @@
+from inspect import getattr_static
+from itertools import repeat
+from types import FunctionType
 from typing import Tuple, Union
 
 import numpy as np
-from matplotlib import pyplot as plt
+from matplotlib.axes import Axes as MplAxes
+from matplotlib.figure import Figure as MplFigure
 
 import mplex.axes
 from mplex import core
-from mplex.annotate import add_bar
+from mplex.annotate import add_bar, add_bars
 from mplex.axes import (
     Axes,
     add_axes,
@@ -15,10 +19,52 @@ from mplex.axes import (
     set_visible_sides,
 )
 
+_method_cache = {}
+
+
+def _get_method(cls: type, name: str):
+    """Get the plain function ``name`` of ``cls``, or None if it is not one."""
+    key = (cls, name)
+
+    try:
+        return _method_cache[key]
+    except KeyError:
+        try:
+            attr = getattr_static(cls, name)
+        except AttributeError:
+            attr = None
+
+        method = attr if isinstance(attr, FunctionType) else None
+        _method_cache[key] = method
+        return method
+
+
+class PerAxes:
+    """Mark an argument of a broadcast call as one value per axes.
+
+    The leading dimensions of ``values`` must match the shape of the AxArray,
+    e.g. ``g.set_xlim(PerAxes(xlims))`` with ``xlims`` of shape
+    (nrows, ncols, 2).
+    """
+
+    def __init__(self, values):
+        self.values = values
+
+    def ravel(self, shape):
+        values = np.asarray(self.values)
+
+        if values.shape[: len(shape)] != shape:
+            raise ValueError(
+                f"Per-axes values of shape {values.shape} do not match axes "
+                f"of shape {shape}"
+            )
+
+        return values.reshape((-1, *values.shape[len(shape) :]))
+
 
 class AxArray:
     def __init__(self, axs):
-        if isinstance(axs, plt.Axes):
+        if isinstance(axs, MplAxes):
             axs = [axs]
 
         self._axs = np.asarray(list(axs))
@@ -30,6 +76,13 @@ class AxArray:
         return self._axs.__getitem__(item)
 
     def __getattr__(self, name: str):
+        methods = self._get_methods(name)
+
+        if methods is not None:
+            return lambda *args, collect=True, **kwargs: self._broadcast(
+                name, methods, args, kwargs, collect
+            )
+
         a = np.array([getattr(ax, name) for ax in self._axs.ravel()], object).reshape(
             (*self._axs.shape, -1)
         )
@@ -42,6 +95,78 @@ class AxArray:
 
         return a
 
+    def _get_methods(self, name: str):
+        """Map each axes class to its method ``name``, or return None."""
+        methods = {cls: _get_method(cls, name) for cls in set(map(type, self))}
+
+        if not all(methods.values()):
+            return None
+
+        # instance attributes shadow methods
+        if any(name in vars(ax) for ax in self):
+            return None
+
+        return methods
+
+    def _iter_args(self, args, kwargs):
+        shape = self._axs.shape
+        split_args = {
+            i: v.ravel(shape) for i, v in enumerate(args) if isinstance(v, PerAxes)
+        }
+        split_kwargs = {
+            k: v.ravel(shape) for k, v in kwargs.items() if isinstance(v, PerAxes)
+        }
+
+        if not (split_args or split_kwargs):
+            return repeat((args, kwargs))
+
+        return (
+            (
+                tuple(
+                    split_args[i][n] if i in split_args else v
+                    for i, v in enumerate(args)
+                ),
+                {**kwargs, **{k: v[n] for k, v in split_kwargs.items()}},
+            )
+            for n in range(self._axs.size)
+        )
+
+    def broadcast(self, name: str, *args, collect=True, **kwargs):
+        """Call method ``name`` of every axes.
+
+        Arguments wrapped in ``PerAxes`` are split so that each axes gets its
+        own value. Method lookup is cached per axes class.
+
+        Parameters
+        ----------
+        name : str
+            Name of the method.
+        collect : bool
+            If False, discard the return values and return None.
+
+        Returns
+        -------
+        np.ndarray or None
+            Object array of return values, of shape (*self.axs.shape, -1).
+        """
+        return self._broadcast(name, self._get_methods(name), args, kwargs, collect)
+
+    def _broadcast(self, name, methods, args, kwargs, collect=True):
+        arg_iter = zip(self._axs.ravel(), self._iter_args(args, kwargs))
+
+        if methods is None:
+            calls = (getattr(ax, name)(*a, **k) for ax, (a, k) in arg_iter)
+        else:
+            calls = (methods[type(ax)](ax, *a, **k) for ax, (a, k) in arg_iter)
+
+        if not collect:
+            for _ in calls:
+                pass
+
+            return None
+
+        return np.array(list(calls), object).reshape((*self._axs.shape, -1))
+
     @property
     def axs(self):
         return self._axs
@@ -52,7 +177,7 @@ class AxArray:
     def make_ax(self, sharex=None, sharey=None, behind=True):
         axs = list(self)
         gs = axs[0].get_gridspec()
-        fig: plt.Figure = axs[0].figure
+        fig: MplFigure = axs[0].figure
 
         assert all(ax.get_gridspec() is gs for ax in axs)
         assert all(ax.figure is fig for ax in axs)
@@ -177,9 +302,9 @@ class AxArray:
                 sides, spines=spines, ticks=ticks, ticklabels=ticklabels, ax=ax
             )
 
-    def set_tight_bounds(self, x=True, y=True):
+    def set_tight_bounds(self, x=True, y=True, deferred=False):
         for ax in self:
-            mplex.axes.set_tight_bounds(x, y, ax=ax)
+            mplex.axes.set_tight_bounds(x, y, deferred, ax=ax)
 
     def set_tick_direction(self, directions: str):
         for ax in self:
@@ -192,7 +317,7 @@ class AxArray:
 
 class AxArray2D(AxArray):
     def __init__(self, axs):
-        if isinstance(axs, plt.Axes):
+        if isinstance(axs, MplAxes):
             axs = [[axs]]
 
         super().__init__(axs)
@@ -226,3 +351,6 @@ class AxArray2D(AxArray):
 
     def add_bar(self, fro=0, to=-1, side="t", pad=0, **kwargs):
         add_bar(self._axs, fro, to, side, pad, **kwargs)
+
+    def add_bars(self, fro=0, to=-1, side="t", pad=0, **kwargs):
+        return add_bars(self._axs, fro, to, side, pad, **kwargs)
@@ -0,0 +1,189 @@
+from collections import namedtuple
+from typing import Callable, Iterable, Union
+
+import numpy as np
+
+RenderResult = namedtuple("RenderResult", ["index", "input", "output", "error"])
+RenderResult.__doc__ = """Result of rendering one input.
+
+``output`` is the saved path or the image array; ``error`` is the formatted
+traceback if building or rendering failed, else None.
+"""
+
+
+def _init_worker(style):
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    if style is not None:
+        from mplex.style import use_style
+
+        use_style(style)
+
+
+def _render(build, x, path, mode, dtype, savefig_kw):
+    import traceback
+
+    from matplotlib import pyplot as plt
+
+    from mplex.raster import convert_rgba, get_rgba_buffer
+
+    fig = None
+
+    try:
+        fig = build(x)
+        fig = getattr(fig, "fig", fig)
+
+        if path is None:
+            return convert_rgba(get_rgba_buffer(fig.canvas), mode, dtype), None
+
+        fig.savefig(path, **savefig_kw)
+        return path, None
+    except Exception:
+        return None, traceback.format_exc()
+    finally:
+        if fig is not None:
+            plt.close(fig)
+
+
+def render_batch(
+    build: Callable,
+    inputs: Iterable,
+    fname: Union[None, str, Callable] = None,
+    *,
+    processes=None,
+    style="default",
+    ordered=True,
+    max_pending=None,
+    mode="rgba",
+    dtype=np.uint8,
+    **savefig_kw,
+):
+    """Render many figures in a process pool.
+
+    Parameters
+    ----------
+    build : callable
+        Picklable function taking one input and returning a Grid, an mplex
+        Figure or a matplotlib Figure. The figure is closed after rendering.
+    inputs : iterable
+        Inputs passed to ``build``. Consumed lazily.
+    fname : str or callable, optional
+        Output path, either a format string with the ``{index}`` field or a
+        function of (index, input). If None, figures are returned as image
+        arrays (see ``mplex.raster.convert_rgba`` for ``mode`` and ``dtype``).
+    processes : int, optional
+        Number of worker processes. Defaults to the number of CPUs.
+    style : str, optional
+        Style applied in each worker with ``use_style``. None to skip.
+    ordered : bool
+        Yield results in input order rather than as they complete.
+    max_pending : int, optional
+        Maximum number of inputs submitted but not yet yielded, which bounds
+        memory use. Defaults to twice the number of processes.
+    **savefig_kw
+        Passed to ``savefig``.
+
+    Yields
+    ------
+    RenderResult
+        One per input. Failures are reported in ``error`` and do not stop the
+        batch. If a worker dies, the pool is restarted and the inputs that
+        were in flight are rerun one at a time; only an input that breaks
+        the pool again fails.
+    """
+    import os
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from concurrent.futures.process import BrokenProcessPool
+
+    processes = processes or os.cpu_count() or 1
+    max_pending = max_pending or 2 * processes
+    inputs = enumerate(inputs)
+    jobs = {}  # index -> [input, args, future, isolated, result], in input order
+
+    def start():
+        return ProcessPoolExecutor(
+            processes, initializer=_init_worker, initargs=(style,)
+        )
+
+    def submit(job):
+        nonlocal executor
+
+        try:
+            job[2] = executor.submit(_render, *job[1])
+        except BrokenProcessPool:
+            executor.shutdown(wait=False)
+            executor = start()
+            job[2] = executor.submit(_render, *job[1])
+
+    def fill():
+        suspects = [job for job in jobs.values() if job[2] is None]
+
+        # inputs in flight when the pool broke are rerun one at a time, so
+        # that only the one breaking it again fails
+        if suspects:
+            if not any(job[2] is not None and job[4] is None for job in jobs.values()):
+                suspects[0][3] = True
+                submit(suspects[0])
+
+            return
+
+        for i, x in inputs:
+            if fname is None:
+                path = None
+            elif callable(fname):
+                path = fname(i, x)
+            else:
+                path = fname.format(index=i)
+
+            jobs[i] = [x, (build, x, path, mode, dtype, savefig_kw), None, False, None]
+            submit(jobs[i])
+
+            if len(jobs) >= max_pending:
+                break
+
+    def collect(i):
+        x, _, future, isolated, _ = job = jobs[i]
+
+        try:
+            output, error = future.result()
+        except BrokenProcessPool as e:
+            if not isolated:
+                job[2] = None
+                return
+
+            output, error = None, repr(e)
+
+        job[4] = RenderResult(i, x, output, error)
+
+    executor = start()
+
+    try:
+        fill()
+
+        while jobs:
+            running = {
+                job[2]: i
+                for i, job in jobs.items()
+                if job[4] is None and job[2] is not None
+            }
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                collect(running[future])
+
+            if ordered:
+                while jobs and next(iter(jobs.values()))[4] is not None:
+                    yield jobs.pop(next(iter(jobs)))[4]
+            else:
+                for i in [i for i, job in jobs.items() if job[4] is not None]:
+                    yield jobs.pop(i)[4]
+
+            fill()
+    finally:
+        for job in jobs.values():
+            if job[2] is not None:
+                job[2].cancel()
+
+        executor.shutdown()
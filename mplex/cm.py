@@ -1,43 +1,202 @@
+import threading
+from collections import OrderedDict, namedtuple
 from typing import Callable
 
 import numpy as np
-from matplotlib import cm, colors
+from matplotlib import colors
 
 from mplex.colors import remove_bg
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
-def map_cmap(func: Callable, cmap: str | colors.Colormap, lut=None):
-    from matplotlib.colors import ListedColormap
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = dict(hits=0, misses=0, maxsize=0)
+
+
+def enable_cache(maxsize=128):
+    """Cache up to ``maxsize`` derived colormaps (least recently used first out).
+
+    Applies to ``map_cmap``, ``get_transparent_cmap``, ``interp_colors`` and
+    ``lerp_colors``. Keys are the base colormap (its name, or its colors for
+    Colormap objects), the LUT size, the transform function (by identity) and
+    the other parameters. Cached results are copied on the way out, so they
+    can be modified freely. Call ``clear_cache`` after re-registering a
+    colormap name or mutating a transform function.
+    """
+    with _cache_lock:
+        _cache_stats["maxsize"] = maxsize
+        _trim_cache()
+
+
+def disable_cache():
+    enable_cache(0)
+    clear_cache()
+
+
+def clear_cache():
+    """Remove all cached colormaps and reset the statistics."""
+    with _cache_lock:
+        _cache.clear()
+        _cache_stats.update(hits=0, misses=0)
+
+
+def cache_info():
+    with _cache_lock:
+        return CacheInfo(currsize=len(_cache), **_cache_stats)
+
+
+def _trim_cache():
+    while len(_cache) > _cache_stats["maxsize"]:
+        _cache.popitem(last=False)
+
+
+def _cached(get_key: Callable, compute: Callable):
+    # keys of Colormap objects evaluate their table: skip them if disabled
+    if not _cache_stats["maxsize"]:
+        return compute()
+
+    key = get_key()
+
+    with _cache_lock:
+        value = _cache.get(key)
+
+        if value is None:
+            _cache_stats["misses"] += 1
+        else:
+            _cache_stats["hits"] += 1
+            _cache.move_to_end(key)
+
+    if value is None:
+        value = compute()
+
+        with _cache_lock:
+            _cache[key] = value
+            _cache.move_to_end(key)
+            _trim_cache()
+
+    return value.copy()
+
+
+def _get_cmap_key(cmap, lut):
+    if isinstance(cmap, str):
+        return cmap, lut
+
+    if isinstance(cmap, list):
+        return tuple(map(colors.to_rgba, cmap)), lut
+
+    cmap = _get_cmap(cmap, lut)
+    extremes = cmap.get_bad(), cmap.get_under(), cmap.get_over()
+    table = cmap(np.linspace(0, 1, cmap.N))
+    return type(cmap), cmap.name, table.tobytes(), np.array(extremes).tobytes()
+
+
+def _get_cmap(cmap: str | colors.Colormap | list, lut=None):
+    from matplotlib import colormaps
 
     if isinstance(cmap, list):
-        cmap = ListedColormap(cmap)
-    cmap = cm.get_cmap(cmap, lut)
-    return colors.ListedColormap([func(cmap(i)) for i in np.linspace(0, 1, cmap.N)])
+        cmap = colors.ListedColormap(cmap)
+
+    cmap = colormaps.get_cmap(cmap)
+
+    if lut is not None:
+        cmap = cmap.resampled(lut)
+
+    return cmap
+
+
+def map_cmap(func: Callable, cmap: str | colors.Colormap, lut=None, vectorized=False):
+    """Map the colors of a colormap through ``func``.
+
+    If ``vectorized`` is True, ``func`` is called once with the (N, 4) RGBA
+    lookup table and must return an (N, 3) or (N, 4) array. Otherwise it is
+    called with each RGBA color.
+    """
+    return _cached(
+        lambda: ("map", func, vectorized, _get_cmap_key(cmap, lut)),
+        lambda: _map_cmap(func, cmap, lut, vectorized),
+    )
+
+
+def _map_cmap(func: Callable, cmap, lut=None, vectorized=False):
+    cmap = _get_cmap(cmap, lut)
+    table = cmap(np.linspace(0, 1, cmap.N))
+
+    if vectorized:
+        return colors.ListedColormap(func(table))
+
+    return colors.ListedColormap([func(tuple(c)) for c in table])
 
 
 def get_transparent_cmap(cmap, bg, lut=None):
-    return map_cmap(lambda c: remove_bg(c, bg), cmap, lut)
+    return _cached(
+        lambda: ("transparent", colors.to_rgba(bg), _get_cmap_key(cmap, lut)),
+        lambda: _map_cmap(lambda c: remove_bg(c, bg), cmap, lut, vectorized=True),
+    )
 
 
-def lerp_colors(c1, c2, n=256, as_cmap=True, color_space="lab"):
-    from colormath.color_conversions import convert_color
-    from colormath.color_objects import LabColor, LuvColor, sRGBColor
-    from matplotlib.colors import to_rgb
+def interp_colors(colors, n=256, positions=None, as_cmap=True, color_space="lab"):
+    """Interpolate between color stops in CIE Lab or Luv.
 
-    color_space = dict(lab=LabColor, luv=LuvColor)[color_space]
+    Parameters
+    ----------
+    colors : sequence
+        Colors of the stops.
+    n : int
+        Number of output colors.
+    positions : sequence of float, optional
+        Increasing positions of the stops from 0 to 1. Evenly spaced if None.
+    as_cmap : bool
+        Return a ListedColormap instead of an (n, 3) array.
+    color_space : str
+        "lab" or "luv".
+    """
+    from matplotlib.colors import to_rgba
 
-    c1 = convert_color(sRGBColor(*to_rgb(c1)), color_space)
-    c2 = convert_color(sRGBColor(*to_rgb(c2)), color_space)
+    def get_key():
+        return (
+            "interp",
+            tuple(map(to_rgba, colors)),
+            n,
+            None if positions is None else tuple(positions),
+            as_cmap,
+            color_space,
+        )
 
-    colors = np.linspace(c1.get_value_tuple(), c2.get_value_tuple(), n)
-    colors = np.array(
-        [convert_color(color_space(*i), sRGBColor).get_value_tuple() for i in colors]
+    return _cached(
+        get_key, lambda: _interp_colors(colors, n, positions, as_cmap, color_space)
     )
-    colors = np.clip(colors, 0, 1)
 
-    if as_cmap:
-        from matplotlib.colors import ListedColormap
 
+def _interp_colors(colors, n, positions, as_cmap, color_space):
+    from matplotlib.colors import ListedColormap, to_rgba_array
+
+    from mplex.colors import lab_to_rgb, luv_to_rgb, rgb_to_lab, rgb_to_luv
+
+    to_space, from_space = dict(
+        lab=(rgb_to_lab, lab_to_rgb), luv=(rgb_to_luv, luv_to_rgb)
+    )[color_space]
+
+    stops = to_space(to_rgba_array(colors)[:, :3])
+
+    if positions is None:
+        positions = np.linspace(0, 1, len(stops))
+
+    positions = np.asarray(positions, dtype=float)
+    t = np.linspace(0, 1, n)
+    i = np.clip(np.searchsorted(positions, t, "right") - 1, 0, len(stops) - 2)
+    w = ((t - positions[i]) / (positions[i + 1] - positions[i]))[:, None]
+    values = stops[i] + w * (stops[i + 1] - stops[i])
+
+    # colormath, which was used before, defaults to D50 for Lab/Luv colors but
+    # converts sRGB with its native D65 white; keep its colors
+    colors = np.clip(from_space(values, "d50"), 0, 1)
+
+    if as_cmap:
         return ListedColormap(colors)
 
     return colors
+
+
+def lerp_colors(c1, c2, n=256, as_cmap=True, color_space="lab"):
+    return interp_colors([c1, c2], n, as_cmap=as_cmap, color_space=color_space)
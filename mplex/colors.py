@@ -1,6 +1,36 @@
 import numpy as np
 from matplotlib import colors
 
+# sRGB working space, reference whites (2° observer) and Bradford matrix, with
+# the same constants as colormath
+_RGB_TO_XYZ = np.array(
+    [
+        [0.412424, 0.357579, 0.180464],
+        [0.212656, 0.715158, 0.0721856],
+        [0.0193324, 0.119193, 0.950444],
+    ]
+)
+_XYZ_TO_RGB = np.array(
+    [
+        [3.24071, -1.53726, -0.498571],
+        [-0.969258, 1.87599, 0.0415557],
+        [0.0556352, -0.203996, 1.05707],
+    ]
+)
+_WHITES = dict(
+    d50=np.array([0.96422, 1.0, 0.82521]),
+    d65=np.array([0.95047, 1.0, 1.08883]),
+)
+_BRADFORD = np.array(
+    [
+        [0.8951, 0.2664, -0.1614],
+        [-0.7502, 1.7135, 0.0367],
+        [0.0389, -0.0685, 1.0296],
+    ]
+)
+_CIE_E = 216 / 24389
+_CIE_K = 24389 / 27
+
 
 def change_alpha(c, a):
     return colors.to_rgb(c) + (a,)
@@ -19,24 +49,134 @@ def change_hsv(c, h=None, s=None, v=None):
 
 
 def remove_bg(c, bg):
-    if colors.to_hex(bg) == "#ffffff":
-        c = np.array(colors.to_rgb(c))
-        a = max(1 - c)
+    """Get the most transparent color that looks like ``c`` over ``bg``.
+
+    ``c`` is a color, or an array of colors of shape (n, 3) or (n, 4) in which
+    case an (n, 4) array is returned. The alpha of ``c`` is ignored.
+    """
+    single = isinstance(c, str) or np.ndim(c) == 1 and colors.is_color_like(c)
+    rgb = colors.to_rgba_array(c)[:, :3]
+    bg = np.array(colors.to_rgb(bg))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = np.where(rgb > bg, (rgb - bg) / (1 - bg), (bg - rgb) / bg)
+        a = np.where(rgb == bg, 0, a).max(1, keepdims=True)
+        # fully transparent colors are set to the complement of bg
+        rgb = np.where(a == 0, 1 - bg, (rgb - bg) / a + bg)
 
-        if a == 0:
-            return 0, 0, 0, 0
+    rgba = np.hstack([rgb, a])
 
-        r, g, b = (c - 1) / a + 1
+    if single:
+        return tuple(rgba[0])
 
-        return r, g, b, a
-    elif colors.to_hex(bg) == "#000000":
-        c = 1 - np.array(colors.to_rgb(c))
-        r, g, b, a = remove_bg(c, "w")
-        return 1 - r, 1 - g, 1 - b, a
-    else:
-        raise NotImplementedError
+    return rgba
 
 
 def to_gray(c):
     r, g, b = colors.to_rgb(c)
     return r * 0.2126 + g * 0.7152 + b * 0.0722
+
+
+def _get_adaptation_matrix(src: str, dst: str):
+    ratio = (_BRADFORD @ _WHITES[dst]) / (_BRADFORD @ _WHITES[src])
+    return np.linalg.pinv(_BRADFORD) @ np.diag(ratio) @ _BRADFORD
+
+
+def _get_uv(xyz):
+    x, y, z = np.moveaxis(xyz, -1, 0)
+    denom = x + 15 * y + 3 * z
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = np.where(denom == 0, 0, 4 * x / denom)
+        v = np.where(denom == 0, 0, 9 * y / denom)
+
+    return u, v
+
+
+def rgb_to_xyz(rgb):
+    """Convert sRGB colors of shape (..., 3) in [0, 1] to XYZ (D65)."""
+    rgb = np.asarray(rgb, dtype=float)
+
+    with np.errstate(invalid="ignore"):
+        rgb = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+    return np.maximum(rgb @ _RGB_TO_XYZ.T, 0)
+
+
+def xyz_to_rgb(xyz, illuminant="d65"):
+    """Convert XYZ colors of shape (..., 3) to sRGB, without clipping to 1."""
+    xyz = np.asarray(xyz, dtype=float)
+
+    if illuminant != "d65":
+        xyz = xyz @ _get_adaptation_matrix(illuminant, "d65").T
+
+    rgb = np.maximum(xyz @ _XYZ_TO_RGB.T, 0)
+    return np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * rgb ** (1 / 2.4) - 0.055)
+
+
+def xyz_to_lab(xyz, illuminant="d65"):
+    t = np.asarray(xyz, dtype=float) / _WHITES[illuminant]
+
+    with np.errstate(invalid="ignore"):
+        fx, fy, fz = np.moveaxis(
+            np.where(t > _CIE_E, t ** (1 / 3), 7.787 * t + 16 / 116), -1, 0
+        )
+
+    return np.stack([116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)], -1)
+
+
+def lab_to_xyz(lab, illuminant="d65"):
+    lightness, a, b = np.moveaxis(np.asarray(lab, dtype=float), -1, 0)
+    fy = (lightness + 16) / 116
+    f = np.stack([a / 500 + fy, fy, fy - b / 200], -1)
+    t = np.where(f**3 > _CIE_E, f**3, (f - 16 / 116) / 7.787)
+    return t * _WHITES[illuminant]
+
+
+def xyz_to_luv(xyz, illuminant="d65"):
+    xyz = np.asarray(xyz, dtype=float)
+    u, v = _get_uv(xyz)
+    u0, v0 = _get_uv(_WHITES[illuminant])
+    y = xyz[..., 1] / _WHITES[illuminant][1]
+
+    with np.errstate(invalid="ignore"):
+        lightness = 116 * np.where(y > _CIE_E, y ** (1 / 3), 7.787 * y + 16 / 116) - 16
+
+    return np.stack(
+        [lightness, 13 * lightness * (u - u0), 13 * lightness * (v - v0)], -1
+    )
+
+
+def luv_to_xyz(luv, illuminant="d65"):
+    lightness, u, v = np.moveaxis(np.asarray(luv, dtype=float), -1, 0)
+    u0, v0 = _get_uv(_WHITES[illuminant])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = u / (13 * lightness) + u0
+        v = v / (13 * lightness) + v0
+        y = np.where(
+            lightness > _CIE_K * _CIE_E,
+            ((lightness + 16) / 116) ** 3,
+            lightness / _CIE_K,
+        )
+        xyz = np.stack(
+            [y * 9 * u / (4 * v), y, y * (12 - 3 * u - 20 * v) / (4 * v)], -1
+        )
+
+    return np.where((lightness > 0)[..., None], xyz, 0)
+
+
+def rgb_to_lab(rgb, illuminant="d65"):
+    return xyz_to_lab(rgb_to_xyz(rgb), illuminant)
+
+
+def lab_to_rgb(lab, illuminant="d65"):
+    return xyz_to_rgb(lab_to_xyz(lab, illuminant), illuminant)
+
+
+def rgb_to_luv(rgb, illuminant="d65"):
+    return xyz_to_luv(rgb_to_xyz(rgb), illuminant)
+
+
+def luv_to_rgb(luv, illuminant="d65"):
+    return xyz_to_rgb(luv_to_xyz(luv, illuminant), illuminant)
@@ -0,0 +1,159 @@
+import os
+from collections import namedtuple
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.collections import Collection
+from matplotlib.figure import Figure
+from matplotlib.image import _ImageBase
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+
+from mplex.profiling import _count_vertices, _get_name
+
+VECTOR_FORMATS = {"eps", "pdf", "ps", "svg", "svgz"}
+
+RasterPolicy = namedtuple(
+    "RasterPolicy",
+    ["max_vertices", "max_elements", "dpi"],
+    defaults=(10000, 10000, 300),
+)
+RasterPolicy.__doc__ = """Rasterization policy for vector exports.
+
+Artists of the axes with more than ``max_vertices`` vertices or more than
+``max_elements`` elements (paths or offsets of a collection, points of a
+line, pixels of an image) are rasterized at ``dpi``. Axes, ticks and text
+stay vector. A threshold of None disables it.
+"""
+
+ExportReport = namedtuple("ExportReport", ["format", "size", "rasterized"])
+ExportReport.__doc__ = """Result of a ``savefig``.
+
+``size`` is the number of bytes written, or None if unknown. ``rasterized``
+is a structured array (``RASTERIZED_DTYPE``) of the artists rasterized by
+the policy.
+"""
+
+RASTERIZED_DTYPE = np.dtype(
+    [
+        ("row", int),
+        ("col", int),
+        ("artist", object),
+        ("vertices", int),
+        ("elements", int),
+    ]
+)
+
+
+def _count_elements(artist: Artist):
+    if isinstance(artist, Collection):
+        return max(len(artist.get_paths()), len(artist.get_offsets()))
+
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+
+    if isinstance(artist, _ImageBase):
+        a = artist.get_array()
+        return 0 if a is None else int(np.prod(np.shape(a)[:2]))
+
+    return 1
+
+
+def get_dense_artists(fig: Figure, policy: RasterPolicy, axes=None):
+    """Find the artists of the axes of ``fig`` exceeding the thresholds.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array of dtype ``RASTERIZED_DTYPE``, keyed by the grid
+        position of each axes in ``axes`` (or (-1, -1)).
+    list of Artist
+        The matching artists, in the same order.
+    """
+    max_vertices = np.inf if policy.max_vertices is None else policy.max_vertices
+    max_elements = np.inf if policy.max_elements is None else policy.max_elements
+    positions = {}
+
+    if axes is not None:
+        positions = {ax: ij for ij, ax in np.ndenumerate(axes) if ax is not None}
+
+    rows, artists = [], []
+
+    for ax in fig.axes:
+        i, j = positions.get(ax, (-1, -1))
+
+        for a in ax.get_children():
+            if not isinstance(a, (Collection, Line2D, _ImageBase, Patch)):
+                continue
+
+            if a is ax.patch or a in ax.spines.values() or a.get_rasterized():
+                continue
+
+            v, n = _count_vertices(a), _count_elements(a)
+
+            if v > max_vertices or n > max_elements:
+                rows.append((i, j, _get_name(a), v, n))
+                artists.append(a)
+
+    return np.array(rows, RASTERIZED_DTYPE), artists
+
+
+def _get_format(fname, kwargs):
+    from matplotlib import rcParams
+
+    fmt = kwargs.get("format")
+
+    if fmt is None and isinstance(fname, (str, os.PathLike)):
+        fmt = os.path.splitext(os.fspath(fname))[1][1:]
+
+    return (fmt or rcParams["savefig.format"]).lower()
+
+
+def savefig(fig: Figure, fname, policy: RasterPolicy = None, axes=None, **kwargs):
+    """Save a figure, rasterizing dense artists for vector formats.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+    fname : str, path-like or file-like
+    policy : RasterPolicy, optional
+        Applied while saving to a vector format, after which the artists are
+        restored. ``dpi`` is passed to ``savefig`` unless given in
+        ``kwargs``. None saves the figure as is.
+    axes : np.ndarray, optional
+        2D object array of axes used to key the report by grid position.
+    **kwargs
+        Passed to ``savefig``.
+
+    Returns
+    -------
+    ExportReport
+    """
+    fmt = _get_format(fname, kwargs)
+    rasterized, artists = np.array([], RASTERIZED_DTYPE), []
+
+    if policy is not None and fmt in VECTOR_FORMATS:
+        rasterized, artists = get_dense_artists(fig, policy, axes)
+
+        if artists:
+            kwargs.setdefault("dpi", policy.dpi)
+
+    start = fname.tell() if hasattr(fname, "tell") else None
+
+    try:
+        for a in artists:
+            a.set_rasterized(True)
+
+        fig.savefig(fname, **kwargs)
+    finally:
+        for a in artists:
+            a.set_rasterized(False)
+
+    if start is not None:
+        size = fname.tell() - start
+    elif isinstance(fname, (str, os.PathLike)) and os.path.exists(fname):
+        size = os.path.getsize(fname)
+    else:
+        size = None
+
+    return ExportReport(fmt, size, rasterized)
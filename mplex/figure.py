@@ -1,16 +1,59 @@
-from matplotlib import pyplot as plt
+import threading
 
 from mplex.utils import convert_unit, safe_unpack
 
 
 class Figure:
-    def __init__(self, size, unit="pt", **kwargs):
+    """Figure of a given size.
+
+    If ``pyplot`` is False, a ``matplotlib.figure.Figure`` with an Agg canvas
+    is created directly. It is not registered with pyplot, so it is garbage
+    collected once unreferenced and can be used from worker threads (one
+    figure per thread). Use ``close()`` or a ``with`` block to release it.
+    """
+
+    def __init__(self, size, unit="pt", pyplot=True, **kwargs):
         self.size = safe_unpack(size)
         size_inch = convert_unit(self.size, unit, "in")
-        self._fig = plt.figure(figsize=size_inch, **kwargs)
+
+        if pyplot:
+            from matplotlib import pyplot as plt
+
+            self._fig = plt.figure(figsize=size_inch, **kwargs)
+        else:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure as MplFigure
+
+            self._fig = MplFigure(figsize=size_inch, **kwargs)
+            FigureCanvasAgg(self._fig)
+
         self._fig.subplots_adjust(0, 0, 1, 1, 0, 0)
+        self._pyplot = pyplot
+        self._lock = threading.RLock()
         self.unit = unit
-        self.savefig = self._fig.savefig
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the figure and free the memory held by its artists."""
+        if self._pyplot:
+            from matplotlib import pyplot as plt
+
+            plt.close(self._fig)
+
+        self._fig.clear()
+
+    def savefig(self, *args, **kwargs):
+        with self._lock:
+            return self._fig.savefig(*args, **kwargs)
+
+    @property
+    def fig(self):
+        return self._fig
 
     @property
     def width_pt(self):
@@ -4,18 +4,65 @@ import numpy as np
 from matplotlib.gridspec import GridSpec
 
 from mplex import core
-from mplex.axes import Axes
+from mplex.animation import iter_frames, pipe_frames
+from mplex.axes import (
+    Axes,
+    get_decoration_extents,
+    get_tick_direction_kw,
+    get_visible_sides_kw,
+)
 from mplex.axes_collection import AxArray2D
 from mplex.figure import Figure
-from mplex.utils import safe_len, safe_unpack, to_array
+from mplex.raster import IncrementalDraw, convert_rgba, get_rgba_buffer
+from mplex.utils import convert_unit, safe_len, safe_unpack, to_array
 
 
 def _get_shared_ax(row: int, col: int, how: str, axs: np.ndarray):
     how = core.get_share_ax_name(how)
-    return {"row": axs[row, 0], "col": axs[0, col], "all": axs[0, 0]}.get(how, None)
+    group = {"row": axs[row], "col": axs[:, col], "all": axs.ravel()}.get(how, ())
+    return next((ax for ax in group if ax is not None), None)
+
+
+def _get_inner_ticklabels_kw(
+    row: int, col: int, shape, sharex="col", sharey="row", ticklabels_sides="lb"
+):
+    nrow, ncol = shape
+    sharex = core.get_share_ax_name(sharex)
+    sharey = core.get_share_ax_name(sharey)
+    ticklabels_sides = core.get_side_names(ticklabels_sides)
+    kw = {}
+
+    if sharex in ("all", "col"):
+        if "bottom" in ticklabels_sides and row < nrow - 1:
+            kw["labelbottom"] = False
+        if "top" in ticklabels_sides and row > 0:
+            kw["labeltop"] = False
+
+    if sharey in ("all", "row"):
+        if "left" in ticklabels_sides and col > 0:
+            kw["labelleft"] = False
+        if "right" in ticklabels_sides and col < ncol - 1:
+            kw["labelright"] = False
+
+    return kw
+
+
+_X_TICK_KEYS = {"bottom", "top", "labelbottom", "labeltop"}
+_Y_TICK_KEYS = {"left", "right", "labelleft", "labelright"}
+
+
+def _split_tick_kw(kw: dict):
+    """Split ``tick_params`` kwargs into kwargs of each axis."""
+    xkw = {k: v for k, v in kw.items() if k not in _Y_TICK_KEYS}
+    ykw = {k: v for k, v in kw.items() if k not in _X_TICK_KEYS}
+    return xkw, ykw
 
 
 class Grid(Figure):
+    _incremental = None
+    _raster_policy = None
+    _profiler = None
+
     def __init__(
         self,
         axsize=(100, 100),
@@ -31,6 +78,8 @@ class Grid(Figure):
         ticks_sides="lb",
         ticklabels_sides="lb",
         keep_inner_ticklabels=None,
+        lazy=False,
+        cache_ticks=True,
         **kwargs,
     ):
         axw, axh = safe_unpack(axsize)
@@ -55,7 +104,7 @@ class Grid(Figure):
 
         if len(hspace) < nrow - 1:
             hspace = hspace[np.arange(nrow - 1) % len(hspace)]
-        
+
         if not hasattr(border, "__len__"):
             border = (border, border, border, border)
         elif len(border) == 2:
@@ -98,38 +147,105 @@ class Grid(Figure):
         self._sharex = core.get_share_ax_name(sharex)
         self._sharey = core.get_share_ax_name(sharey)
 
-        for i, j in product(range(nrow), range(ncol)):
-            self._axes[i, j] = Axes(
-                self._fig,
-                self._gs[i * 2 + 1, j * 2 + 1],
-                sharex=_get_shared_ax(i, j, self._sharex, self._axes),
-                sharey=_get_shared_ax(i, j, self._sharey, self._axes),
-            )
-            self._fig.add_subplot(self._axes[i, j])
-
-        self._ca = self[:]
-
+        self._lazy = lazy
+        self._cache_ticks = cache_ticks
         ticks_sides = core.get_side_names(ticks_sides)
-        self._ticklabels_sides = (
+        ticklabels_sides = (
             ticks_sides
             if ticklabels_sides is None
             else core.get_side_names(ticklabels_sides)
         )
-        self._ca.set_visible(
-            ticks=ticks_sides, ticklabels=self._ticklabels_sides, spines=spines
+
+        # final styling shared by all cells, see _style_ax
+        self._spines_kw, tick_kw = get_visible_sides_kw(
+            spines=spines, ticks=ticks_sides, ticklabels=ticklabels_sides
         )
-        self._ca.set_tick_direction(tickdir)
+        self._tick_kw = _split_tick_kw(tick_kw)
+
+        for kw, direction_kw in zip(
+            self._tick_kw, get_tick_direction_kw(tickdir).values()
+        ):
+            kw.update(direction_kw)
 
         if keep_inner_ticklabels is None:
-            self._ca.remove_inner_ticklabels(sharex, sharey, ticklabels_sides)
+            self._inner_ticklabels = (sharex, sharey, ticklabels_sides)
         elif keep_inner_ticklabels is False:
-            self._ca.remove_inner_ticklabels()
+            self._inner_ticklabels = ()
+        else:
+            self._inner_ticklabels = None
+
+        if lazy:
+            # axes are created on first access, see _get_ax
+            self._ca = None
+            return
+
+        for i, j in product(range(nrow), range(ncol)):
+            self._add_ax(i, j)
+            self._style_ax(i, j)
+
+        self._ca = self[:]
+
+    def _add_ax(self, row: int, col: int):
+        ax = Axes(
+            self._fig,
+            self._gs[row * 2 + 1, col * 2 + 1],
+            sharex=_get_shared_ax(row, col, self._sharex, self._axes),
+            sharey=_get_shared_ax(row, col, self._sharey, self._axes),
+        )
+        ax._cache_ticks = self._cache_ticks
+        self._fig.add_subplot(ax)
+        self._axes[row, col] = ax
+        return ax
+
+    def _style_ax(self, row: int, col: int):
+        """Apply spine visibility and tick params with one call per axis."""
+        ax = self._axes[row, col]
+        xkw, ykw = self._tick_kw
+
+        if self._inner_ticklabels is not None:
+            kw = _get_inner_ticklabels_kw(
+                row, col, self._axes.shape, *self._inner_ticklabels
+            )
+
+            if kw:
+                inner_xkw, inner_ykw = _split_tick_kw(kw)
+                xkw, ykw = {**xkw, **inner_xkw}, {**ykw, **inner_ykw}
+
+        for side, visible in self._spines_kw.items():
+            ax.spines[side].set_visible(visible)
+
+        if xkw:
+            ax.xaxis.set_tick_params(**xkw)
+
+        if ykw:
+            ax.yaxis.set_tick_params(**ykw)
+
+    def _get_ax(self, row: int, col: int):
+        ax = self._axes[row, col]
+
+        if ax is None:
+            ax = self._add_ax(row, col)
+            self._style_ax(row, col)
+
+        return ax
 
     def __getattr__(self, name):
-        return getattr(self._ca, name)
+        # private and dunder lookups (hasattr, IPython display probes) must
+        # not create the axes of a lazy grid
+        if name.startswith("_"):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        return getattr(self.ca, name)
 
     def __getitem__(self, key):
-        axs = np.matrix(self.axs)[key]
+        if self._lazy:
+            idx = np.arange(self._axes.size).reshape(self._axes.shape)
+            for k in np.ravel(np.matrix(idx)[key]):
+                self._get_ax(*np.unravel_index(k, self._axes.shape))
+
+        axs = np.matrix(self._axes)[key]
         if isinstance(axs, np.matrix):
             return AxArray2D(np.array(axs))
         return axs
@@ -144,16 +260,19 @@ class Grid(Figure):
 
     @property
     def axs(self):
+        if self._lazy:
+            for i, j in product(range(self.nrows), range(self.ncols)):
+                self._get_ax(i, j)
+
         return self._axes
 
     @property
     def ca(self):
         """Current axes"""
-        return self._ca
+        if self._ca is None:
+            self._ca = self[:]
 
-    @property
-    def fig(self):
-        return self._fig
+        return self._ca
 
     @property
     def gs(self):
@@ -163,9 +282,195 @@ class Grid(Figure):
         """Set current axes"""
         self._ca = self[keys]
 
-    def to_rgba_array(self):
-        canvas = self.fig.canvas
-        canvas.draw()
-        img = np.frombuffer(canvas.buffer_rgba(), dtype=np.uint8)
-        img = img.reshape(canvas.get_width_height()[::-1] + (4,))
-        return img
+    def fit_layout(self, pad=0):
+        """Fit the spaces between and around the axes to their decorations.
+
+        Tick labels, axis labels and titles are measured with cached text
+        metrics, without drawing. The axes keep their size; the figure grows or
+        shrinks instead. Call it after plotting, once ticks and labels are set.
+        Axes added outside of the grid spec (e.g. colorbars) are not taken into
+        account.
+
+        Parameters
+        ----------
+        pad : float
+            Extra space added to every space and border, in the grid unit.
+        """
+        extents = np.zeros((self.nrows, self.ncols, 4))
+
+        for (i, j), ax in np.ndenumerate(self._axes):
+            if ax is not None:
+                extents[i, j] = get_decoration_extents(ax=ax)
+
+        left, right, bottom, top = np.moveaxis(
+            convert_unit(extents, "pt", self.unit), -1, 0
+        )
+        wspace = [
+            [left[:, 0].max()],
+            (right[:, :-1] + left[:, 1:]).max(0, initial=0),
+            [right[:, -1].max()],
+        ]
+        hspace = [
+            [top[0].max()],
+            (bottom[:-1] + top[1:]).max(1, initial=0),
+            [bottom[-1].max()],
+        ]
+
+        self.gridw = self.gridw.astype(float)
+        self.gridh = self.gridh.astype(float)
+        self.gridw[::2] = np.concatenate(wspace) + pad
+        self.gridh[::2] = np.concatenate(hspace) + pad
+        self.size = self.gridw.sum(), self.gridh.sum()
+
+        self._fig.set_size_inches(convert_unit(self.size, self.unit, "in"))
+        self._gs.set_width_ratios(self.gridw)
+        self._gs.set_height_ratios(self.gridh)
+
+        for ax in self._fig.axes:
+            ss = ax.get_subplotspec()
+
+            if ss is not None and ss.get_gridspec() is self._gs:
+                ax.set_subplotspec(ss)
+
+    def montage(self, images, cmap="gray", vmin=None, vmax=None, dpi=None, **kwargs):
+        """Draw images in the cells as a single image artist.
+
+        See ``mplex.montage.Montage``. Use a lazy grid so that no axes are
+        created for the cells.
+        """
+        from mplex.montage import Montage
+
+        return Montage(self, images, cmap, vmin, vmax, dpi, **kwargs)
+
+    def enable_profiling(self, every=1):
+        """Profile the draw time of each axes and artist.
+
+        Parameters
+        ----------
+        every : int
+            Profile one draw out of ``every``; the other draws are almost
+            free, so sampling can be left enabled.
+
+        Returns
+        -------
+        mplex.profiling.DrawProfiler
+            Use ``report()`` or ``table()`` to get the results, keyed by the
+            grid position of each axes.
+        """
+        from mplex.profiling import DrawProfiler
+
+        self.disable_profiling()
+        self._profiler = DrawProfiler(self._fig, self._axes, every)
+        return self._profiler
+
+    def disable_profiling(self):
+        if self._profiler is not None:
+            self._profiler.close()
+            self._profiler = None
+
+    @property
+    def profiler(self):
+        return self._profiler
+
+    def set_raster_policy(self, max_vertices=10000, max_elements=10000, dpi=300):
+        """Rasterize dense artists when saving to a vector format.
+
+        Artists of the axes with more than ``max_vertices`` vertices or more
+        than ``max_elements`` elements are rasterized at ``dpi`` by
+        ``savefig`` (see ``mplex.export.RasterPolicy``). Axes, ticks and text
+        stay vector. Use ``disable_raster_policy()`` to turn it off.
+        """
+        from mplex.export import RasterPolicy
+
+        self._raster_policy = RasterPolicy(max_vertices, max_elements, dpi)
+        return self._raster_policy
+
+    def disable_raster_policy(self):
+        self._raster_policy = None
+
+    def savefig(self, fname, **kwargs):
+        """Save the figure, applying the raster policy to vector formats.
+
+        Returns
+        -------
+        mplex.export.ExportReport
+            Format, number of bytes written, and the rasterized artists keyed
+            by grid position.
+        """
+        from mplex.export import savefig
+
+        with self._lock:
+            return savefig(self._fig, fname, self._raster_policy, self._axes, **kwargs)
+
+    async def savefig_async(self, fname, **kwargs):
+        """Awaitable ``savefig`` run in a bounded thread pool.
+
+        See ``mplex.aio.savefig``.
+        """
+        from mplex import aio
+
+        return await aio.savefig(self, fname, **kwargs)
+
+    def to_rgba_array(self, out=None, mode="rgba", dtype=np.uint8, incremental=False):
+        """Draw the figure and return its pixels.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Preallocated array to write into, e.g. reused across figures.
+        mode : str
+            "rgba", "rgb" or "gray".
+        dtype
+            uint8 or a float dtype (values in [0, 1]).
+        incremental : bool
+            Only redraw the regions of the axes that changed since the last
+            incremental call, giving the same pixels as a full draw (see
+            ``mplex.raster.IncrementalDraw``).
+
+        Returns
+        -------
+        np.ndarray
+            ``out`` if given. Otherwise, for uint8 RGBA, a read-only view of the
+            canvas buffer without any copy: it is overwritten by the next draw
+            and stops tracking the canvas when the figure size or dpi changes.
+            Other modes/dtypes are converted into a new array in one pass.
+        """
+        with self._lock:
+            if incremental:
+                if self._incremental is None:
+                    self._incremental = IncrementalDraw(self._fig)
+
+                self._incremental.draw()
+                img = get_rgba_buffer(self.fig.canvas, draw=False)
+            else:
+                img = get_rgba_buffer(self.fig.canvas)
+
+            if out is None and mode == "rgba" and np.dtype(dtype) == np.uint8:
+                return img
+
+            return convert_rgba(img, mode, dtype, out)
+
+    async def to_rgba_array_async(
+        self, out=None, mode="rgba", dtype=np.uint8, incremental=False
+    ):
+        """Awaitable ``to_rgba_array`` run in a bounded thread pool.
+
+        Returns a copy of the pixels. See ``mplex.aio.to_rgba_array``.
+        """
+        from mplex import aio
+
+        return await aio.to_rgba_array(self, out, mode, dtype, incremental=incremental)
+
+    def iter_frames(self, update, frames, artists=(), copy=True):
+        """Yield RGBA frames, blitting only changed axes.
+
+        See ``mplex.animation.iter_frames``.
+        """
+        return iter_frames(self.fig, update, frames, artists, copy)
+
+    def pipe_frames(self, cmd, update, frames, artists=()):
+        """Pipe raw RGBA frames into an encoder subprocess.
+
+        See ``mplex.animation.pipe_frames``.
+        """
+        return pipe_frames(self.fig, cmd, update, frames, artists)
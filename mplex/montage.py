@@ -0,0 +1,223 @@
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import Normalize
+from matplotlib.transforms import (
+    Affine2D,
+    Bbox,
+    BboxTransformTo,
+    ScaledTranslation,
+    TransformedBbox,
+)
+
+from mplex.utils import convert_unit
+
+
+def _get_edges(sizes, unit, dpi):
+    return convert_unit(np.r_[0, np.cumsum(sizes)], unit, "in") * dpi
+
+
+def _get_pixel_range(start, stop):
+    """Pixels whose centers are in [start, stop)."""
+    return int(np.ceil(start - 0.5)), int(np.ceil(stop - 0.5))
+
+
+def _clip_pixel_range(start, stop, size):
+    """Clip a pixel range to [0, size), with the slice of its pixels kept."""
+    a = min(max(start, 0), size)
+    b = min(max(stop, a), size)
+    return a, b, slice(a - start, b - start)
+
+
+def _get_sample_index(n, start, stop):
+    """Index into n samples for the pixels whose centers are in [start, stop)."""
+    centers = np.arange(*_get_pixel_range(start, stop)) + 0.5
+    return np.clip(((centers - start) / (stop - start) * n).astype(int), 0, n - 1)
+
+
+class Montage:
+    """Images of a Grid packed into a single image artist.
+
+    The images are resampled (nearest neighbor) into the cells of the grid,
+    given by ``gridw`` and ``gridh``, of one preallocated array drawn by a
+    single ``imshow`` on an axes covering the whole figure. Use it with a lazy
+    Grid so that no axes are created for the cells.
+
+    Parameters
+    ----------
+    grid : Grid
+    images : sequence of arrays
+        2D scalar images or RGB(A) images, filling the cells row by row.
+    cmap, vmin, vmax
+        Color mapping of scalar images, shared by all of them.
+    dpi : float, optional
+        Resolution of the composite image. Defaults to the figure dpi.
+    **kwargs
+        Passed to ``imshow``.
+    """
+
+    def __init__(
+        self, grid, images, cmap="gray", vmin=None, vmax=None, dpi=None, **kwargs
+    ):
+        self.grid = grid
+        self.dpi = grid.fig.dpi if dpi is None else dpi
+        self.cmap = cmap
+        self.norm = Normalize(vmin, vmax)
+        self._limits = vmin, vmax
+        self._index_cache = {}
+
+        # the canvas has a whole number of pixels, counted from the bottom
+        self.xedges = _get_edges(grid.gridw, grid.unit, self.dpi)
+        self.yedges = _get_edges(grid.gridh, grid.unit, self.dpi)
+        self.yedges -= self.yedges[-1] % 1
+
+        self.ax = grid.fig.add_axes((0, 0, 1, 1), label="montage")
+        self.ax.axis("off")
+        self.array = None
+        self.image = None
+        self.image_shapes = []
+        self.set_images(images, **kwargs)
+
+    @property
+    def shape(self):
+        return self.grid.nrows, self.grid.ncols
+
+    def get_cell_extent(self, i, j):
+        """Bounds (x0, x1, y0, y1) of cell (i, j) in the composite array.
+
+        Bounds are in pixels of the composite array but not rounded.
+        """
+        x0, x1 = self.xedges[2 * j + 1 : 2 * j + 3]
+        y0, y1 = self.yedges[2 * i + 1 : 2 * i + 3]
+        return x0, x1, y0, y1
+
+    def _resample(self, img, x0, x1, y0, y1):
+        # sample at pixel centers, like imshow with nearest interpolation
+        key = img.shape[:2], x0 % 1, x1 - x0, y0 % 1, y1 - y0
+        index = self._index_cache.get(key)
+
+        if index is None:
+            rows = _get_sample_index(img.shape[0], y0, y1)
+            cols = _get_sample_index(img.shape[1], x0, x1)
+            index = self._index_cache[key] = rows[:, None], cols
+
+        return img[index]
+
+    def set_images(self, images, **kwargs):
+        """Pack new images, reusing the composite array if possible."""
+        images = [np.asarray(img) for img in images]
+        n = np.prod(self.shape)
+
+        if len(images) > n:
+            raise ValueError(f"{len(images)} images do not fit in {n} cells")
+
+        self.image_shapes = [img.shape[:2] for img in images]
+        self.norm.vmin, self.norm.vmax = self._limits
+        rgba = any(img.ndim == 3 for img in images)
+        shape = (int(self.yedges[-1]), int(self.xedges[-1]))
+        shape += (4,) if rgba else ()
+
+        if self.array is None or self.array.shape != shape:
+            self.array = np.empty(shape)
+
+        self.array[...] = np.nan if not rgba else 0
+
+        if rgba and any(img.ndim == 2 for img in images):
+            from matplotlib import colormaps
+
+            self.norm.autoscale_None(
+                np.concatenate([img.ravel() for img in images if img.ndim == 2])
+            )
+            cmap = colormaps.get_cmap(self.cmap)
+            images = [cmap(self.norm(img)) if img.ndim == 2 else img for img in images]
+
+        for k, img in enumerate(images):
+            x0, x1, y0, y1 = self.get_cell_extent(*divmod(k, self.shape[1]))
+            cell = self._resample(img, x0, x1, y0, y1)
+            # outer cells may extend past the canvas by up to one pixel
+            x0, x1, cols = _clip_pixel_range(*_get_pixel_range(x0, x1), shape[1])
+            y0, y1, rows = _clip_pixel_range(*_get_pixel_range(y0, y1), shape[0])
+            cell = cell[rows, cols]
+
+            if not rgba:
+                self.array[y0:y1, x0:x1] = cell
+                continue
+
+            if cell.dtype == np.uint8:
+                cell = cell / 255
+
+            self.array[y0:y1, x0:x1, : cell.shape[2]] = cell
+
+            if cell.shape[2] == 3:
+                self.array[y0:y1, x0:x1, 3] = 1
+
+        if self.image is None:
+            h, w = self.array.shape[:2]
+            y0 = self.yedges[0]
+            kwargs = dict(dict(interpolation="nearest", aspect="auto"), **kwargs)
+            self.image = self.ax.imshow(
+                self.array, self.cmap, self.norm, extent=(0, w, h, 0), **kwargs
+            )
+            self.ax.set_xlim(0, self.xedges[-1])
+            self.ax.set_ylim(h, y0)
+        else:
+            if not rgba:
+                # the gaps between cells are NaN
+                self.norm.autoscale_None(np.ma.masked_invalid(self.array))
+
+            self.image.set_data(self.array)
+
+        return self.image
+
+    def _get_cell_bbox(self, i, j):
+        gridw, gridh = self.grid.gridw, self.grid.gridh
+        x = np.r_[0, np.cumsum(gridw)] / gridw.sum()
+        y = 1 - np.r_[0, np.cumsum(gridh)] / gridh.sum()
+        return Bbox.from_extents(x[2 * j + 1], y[2 * i + 2], x[2 * j + 2], y[2 * i + 1])
+
+    def cell_transform(self, i, j, coords="axes"):
+        """Transform from the coordinates of cell (i, j) to display.
+
+        Parameters
+        ----------
+        coords : str
+            "axes" for (0, 0) at the bottom left and (1, 1) at the top right
+            of the cell, or "image" for pixel coordinates of the k-th image
+            (origin at the top left), as used by ``imshow``.
+        """
+        fig = self.grid.fig
+        trans = BboxTransformTo(
+            TransformedBbox(self._get_cell_bbox(i, j), fig.transFigure)
+        )
+
+        if coords == "axes":
+            return trans
+
+        if coords == "image":
+            k = i * self.shape[1] + j
+            h, w = self.image_shapes[k]
+            return Affine2D().scale(1 / w, -1 / h).translate(0, 1) + trans
+
+        raise ValueError(f"Invalid coords: {coords}")
+
+    def set_titles(self, titles, pad=2, **kwargs):
+        """Add a title above each cell. ``pad`` is in points."""
+        offset = ScaledTranslation(0, pad / 72, self.grid.fig.dpi_scale_trans)
+        kwargs = dict(dict(ha="center", va="bottom", clip_on=False), **kwargs)
+        texts = []
+
+        for k, s in enumerate(titles):
+            trans = self.cell_transform(*divmod(k, self.shape[1])) + offset
+            texts.append(self.ax.text(0.5, 1, s, transform=trans, **kwargs))
+
+        return texts
+
+    def add_borders(self, n=None, **kwargs):
+        """Draw the borders of the first ``n`` cells as a single collection."""
+        n = np.prod(self.shape) if n is None else n
+        boxes = [self._get_cell_bbox(*divmod(k, self.shape[1])) for k in range(n)]
+        verts = [
+            [(b.x0, b.y0), (b.x1, b.y0), (b.x1, b.y1), (b.x0, b.y1)] for b in boxes
+        ]
+        kwargs = dict(dict(facecolors="none", edgecolors="k", clip_on=False), **kwargs)
+        pc = PolyCollection(verts, transform=self.grid.fig.transFigure, **kwargs)
+        return self.ax.add_collection(pc, autolim=False)
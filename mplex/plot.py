@@ -1,10 +1,86 @@
 import numpy as np
+from matplotlib.collections import LineCollection
 
 
-def cplot(x, y, c=None, cmap="viridis", vmin=0, vmax=1, *, ax, **kwargs):
+def _get_minmax_indices(x, y, x0, x1, n_bins: int):
+    """Indices of the first, last, min and max points of each bin of x.
+
+    ``x`` must be sorted. Points just outside [x0, x1] are kept so that lines
+    leaving the view are still drawn.
+    """
+    i0 = max(np.searchsorted(x, x0, "right") - 1, 0)
+    i1 = min(np.searchsorted(x, x1, "left") + 1, len(x))
+    xs, ys = x[i0:i1], y[i0:i1]
+
+    if len(xs) <= 4 * n_bins:
+        return np.arange(i0, i1)
+
+    bins = np.floor((xs - x0) / (x1 - x0) * n_bins)
+    starts = np.flatnonzero(np.diff(bins, prepend=bins[0] - 1))
+    counts = np.diff(starts, append=len(xs))
+    groups = np.repeat(np.arange(len(starts)), counts)
+    indices = [starts, starts + counts - 1]
+
+    for reduce in (np.fmin, np.fmax):
+        hits = np.flatnonzero(ys == reduce.reduceat(ys, starts)[groups])
+        _, first = np.unique(groups[hits], return_index=True)
+        indices.append(hits[first])
+
+    return np.unique(np.concatenate(indices)) + i0
+
+
+class _LODLineCollection(LineCollection):
+    """LineCollection of a trace decimated to min/max per pixel column.
+
+    Segments are rebuilt from the full data whenever the x limits or the pixel
+    width of the axes change. The color of each decimated segment is the mean
+    of the values of the segments it replaces.
+    """
+
+    def __init__(self, x, y, values, to_colors, ax, **kwargs):
+        self._lod_data = x, y, values, to_colors
+        self._lod_key = None
+        super().__init__([], **kwargs)
+        self._update_lod(ax, ax.get_window_extent().width, (x[0], x[-1]))
+
+    def _update_lod(self, ax, width, xlim):
+        x0, x1 = sorted(xlim)
+        key = (x0, x1, width)
+
+        if key == self._lod_key:
+            return
+
+        self._lod_key = key
+        x, y, values, to_colors = self._lod_data
+        n_bins = max(int(np.ceil(width)), 1)
+        i = _get_minmax_indices(x, y, x0, x1, n_bins)
+
+        if len(i) < 2:
+            self.set_segments([])
+            return
+
+        points = np.column_stack([x[i], y[i]])[:, None]
+        values = np.add.reduceat(values[: i[-1]], i[:-1], axis=0)
+        values = values / np.diff(i).reshape((-1,) + (1,) * (values.ndim - 1))
+
+        self.set_segments(np.concatenate([points[:-1], points[1:]], axis=1))
+        self.set_color(values if to_colors is None else to_colors(values))
+
+    def draw(self, renderer):
+        ax = self.axes
+        self._update_lod(ax, ax.get_window_extent().width, ax.get_xlim())
+        super().draw(renderer)
+
+
+def cplot(x, y, c=None, cmap="viridis", vmin=0, vmax=1, lod=False, *, ax, **kwargs):
+    """Plot a line colored segment by segment.
+
+    If ``lod`` is True, ``x`` must be sorted, and the line is reduced to the
+    first, last, min and max points of each pixel column of the axes. It is
+    recomputed when the x limits or the size of the axes change.
+    """
     from matplotlib import colormaps
-    from matplotlib.collections import LineCollection
-    from matplotlib.colors import Normalize, is_color_like
+    from matplotlib.colors import Normalize, is_color_like, to_rgba_array
 
     assert len(x) == len(y)
     n = len(x)
@@ -12,18 +88,148 @@ def cplot(x, y, c=None, cmap="viridis", vmin=0, vmax=1, *, ax, **kwargs):
     if c is None:
         c = np.linspace(0, 1, n - 1)
 
-    c = np.array(list(c))
+    # a single color for the whole line
+    if isinstance(c, str) or (is_color_like(c) and np.ndim(c) == 1 and len(c) != n - 1):
+        c = np.broadcast_to(to_rgba_array(c), (n - 1, 4))
+
+    c = np.asarray(c if hasattr(c, "__len__") else list(c))
 
     if not is_color_like(c[0]):
         cmap = colormaps.get_cmap(cmap)
         norm = Normalize(vmin, vmax, clip=True)
-        colors = cmap(norm(c))
+
+        def to_colors(values):
+            return cmap(norm(values))
+
+    else:
+        to_colors = None
+
+    if lod:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        if np.any(np.diff(x) < 0):
+            raise ValueError("x must be sorted when lod is True")
+
+        values = c if to_colors is not None else to_rgba_array(c)
+        lc = _LODLineCollection(x, y, values, to_colors, ax, **kwargs, capstyle="round")
+    else:
+        colors = c if to_colors is None else to_colors(c)
+        points = np.column_stack([x, y])[:, None]
+        segments = np.concatenate([points[:-1], points[1:]], axis=1)
+        lc = LineCollection(segments, colors=colors, **kwargs, capstyle="round")
+
+    ax.autoscale()
+
+    return ax.add_collection(lc)
+
+
+def _flatten_lines(a, lengths=None):
+    """Concatenate lines given as a sequence of 1D arrays or a padded 2D array.
+
+    Rows of a 2D array are cut to ``lengths``, or to their number of leading
+    non-NaN values.
+    """
+    if isinstance(a, np.ndarray) and a.ndim == 2:
+        if lengths is None:
+            lengths = np.argmax(
+                np.isnan(np.column_stack([a, np.full(len(a), np.nan)])), 1
+            )
+
+        lengths = np.asarray(lengths)
+        mask = np.arange(a.shape[1]) < lengths[:, None]
+        return a[mask], lengths
+
+    return np.concatenate(a), np.fromiter(map(len, a), int, len(a))
+
+
+def _get_c_per(c, n):
+    """Guess whether ``c`` of ``cplots`` is given per line or per segment."""
+    if len(c) != len(n):
+        return "segment"
+
+    if np.ndim(c[0]) == 0:
+        return "line"
+
+    # rows shorter than the segments of their line are RGB(A) colors
+    if isinstance(c, np.ndarray) and c.ndim == 2:
+        lengths = np.full(len(c), c.shape[1])
     else:
-        colors = c
+        lengths = np.fromiter(map(len, c), int, len(c))
+
+    return "segment" if np.all(lengths >= n - 1) else "line"
 
-    points = np.column_stack([x, y])[:, None]
-    segments = np.concatenate([points[:-1], points[1:]], axis=1)
 
+def cplots(
+    xs,
+    ys,
+    c=None,
+    cmap="viridis",
+    vmin=0,
+    vmax=1,
+    lengths=None,
+    c_per=None,
+    *,
+    ax,
+    **kwargs,
+):
+    """Plot many lines colored segment by segment as a single LineCollection.
+
+    Parameters
+    ----------
+    xs, ys : sequence of 1D arrays or 2D array
+        Lines, either ragged or padded to shape (n_lines, n_points) with NaN
+        (or cut to ``lengths``). NaN inside a line leaves a gap.
+    c : optional
+        One value or color per line, or one value per segment with the same
+        layout as ``xs`` (ragged, or padded along the last axis). Defaults to
+        the position along each line, from 0 to 1.
+    lengths : array of int, optional
+        Number of points of each line of padded arrays.
+    c_per : {"line", "segment"}, optional
+        How ``c`` is given. By default, one scalar or color string per line
+        is per line, and rows are per segment unless shorter than the
+        segments of their line. Pass "line" for RGB(A) colors of lines with
+        at most 4 segments.
+    """
+    from matplotlib import colormaps
+    from matplotlib.colors import Normalize, to_rgba_array
+
+    x, n = _flatten_lines(xs, lengths)
+    y, _ = _flatten_lines(ys, n)
+    assert len(x) == len(y)
+
+    line = np.repeat(np.arange(len(n)), n)
+    start = np.repeat(np.cumsum(n) - n, n)
+    valid = (line[:-1] == line[1:]) & np.isfinite(x[:-1] + y[:-1] + x[1:] + y[1:])
+    colors = None
+
+    if isinstance(c, str):
+        c = [c] * len(n)
+
+    if c is not None and c_per is None:
+        c_per = _get_c_per(c, n)
+
+    if c is None:
+        c = (np.arange(len(x)) - start) / np.maximum(n - 2, 1)[line]
+    elif c_per == "line":
+        if isinstance(c[0], (int, float, np.number)):
+            c = np.asarray(c, dtype=float)[line]
+        else:
+            colors = to_rgba_array(c)[line[:-1][valid]]
+    elif c_per == "segment":
+        c_flat, _ = _flatten_lines(c, n - 1)
+        c = np.full(len(x), np.nan)
+        c[np.arange(len(c_flat)) + np.repeat(np.arange(len(n)), n - 1)] = c_flat
+    else:
+        raise ValueError(f"Invalid c_per: {c_per}")
+
+    if colors is None:
+        norm = Normalize(vmin, vmax, clip=True)
+        colors = colormaps.get_cmap(cmap)(norm(c[:-1][valid]))
+
+    points = np.column_stack([x, y])
+    segments = np.stack([points[:-1][valid], points[1:][valid]], axis=1)
     lc = LineCollection(segments, colors=colors, **kwargs, capstyle="round")
     ax.autoscale()
 
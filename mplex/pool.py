@@ -0,0 +1,263 @@
+import threading
+from contextlib import contextmanager
+from copy import deepcopy
+
+import numpy as np
+
+from mplex.grid import Grid
+
+_UNIT_ATTRS = ("units", "converter", "_converter", "_converter_is_explicit")
+
+
+class _AxesState:
+    def __init__(self, ax):
+        self.children = set(ax.get_children())
+        self.visible = ax.get_visible()
+        self.axison = ax.axison
+        self.facecolor = ax.get_facecolor()
+        self.aspect = ax.get_aspect(), ax.get_adjustable()
+        # read without triggering the autoscaling of pending limits
+        self.data_lim = ax.dataLim.frozen()
+        self.ignore_data_lim = ax.ignore_existing_data_limits
+        self.view_lim = ax._viewLim.get_points().copy()
+        self.stale_view_lim = dict(ax._stale_viewlims)
+        self.autoscale = ax.get_autoscalex_on(), ax.get_autoscaley_on()
+        self.margins = ax._xmargin, ax._ymargin
+        self.titles = {loc: ax.get_title(loc) for loc in ("left", "center", "right")}
+        self.tight_bounds = vars(ax).get("_tight_bounds")
+        self.spines = {
+            side: (spine.get_visible(), spine._bounds)
+            for side, spine in ax.spines.items()
+        }
+        self.axes = {}
+
+        for name, axis in (("x", ax.xaxis), ("y", ax.yaxis)):
+            self.axes[name] = (
+                axis.get_scale(),
+                axis.get_major_locator(),
+                axis.get_major_formatter(),
+                axis.get_minor_locator(),
+                axis.get_minor_formatter(),
+                dict(axis._major_tick_kw),
+                dict(axis._minor_tick_kw),
+                axis.label.get_text(),
+                axis.get_label_position(),
+                axis.get_inverted(),
+                # category units are mutated in place by later plots
+                {
+                    k: deepcopy(v) if k == "units" else v
+                    for k, v in vars(axis).items()
+                    if k in _UNIT_ATTRS
+                },
+            )
+
+    def restore(self, ax):
+        for a in ax.get_children():
+            if a not in self.children:
+                a.remove()
+
+        ax.set_prop_cycle(None)
+        ax.set_visible(self.visible)
+        ax.axison = self.axison
+        ax.set_facecolor(self.facecolor)
+        ax.set_aspect(*self.aspect)
+        ax._tight_bounds = self.tight_bounds
+
+        for loc, title in self.titles.items():
+            ax.set_title(title, loc=loc)
+
+        for side, (visible, bounds) in self.spines.items():
+            ax.spines[side].set_visible(visible)
+            ax.spines[side]._bounds = bounds
+
+        for name, axis in (("x", ax.xaxis), ("y", ax.yaxis)):
+            (
+                scale,
+                major_locator,
+                major_formatter,
+                minor_locator,
+                minor_formatter,
+                major_tick_kw,
+                minor_tick_kw,
+                label,
+                label_position,
+                inverted,
+                units,
+            ) = self.axes[name]
+
+            for k, v in units.items():
+                setattr(axis, k, deepcopy(v) if k == "units" else v)
+
+            if axis.get_scale() != scale:
+                getattr(ax, f"set_{name}scale")(scale)
+
+            axis.set_major_locator(major_locator)
+            axis.set_major_formatter(major_formatter)
+            axis.set_minor_locator(minor_locator)
+            axis.set_minor_formatter(minor_formatter)
+            axis._major_tick_kw = dict(major_tick_kw)
+            axis._minor_tick_kw = dict(minor_tick_kw)
+            axis.reset_ticks()
+            axis.set_label_text(label)
+            axis.set_label_position(label_position)
+            axis.set_inverted(inverted)
+
+    def restore_limits(self, ax):
+        """Reset the limits as they were, including pending autoscaling.
+
+        Setting limits or margins through the API autoscales or updates the
+        shared axes, so this is done once all axes are otherwise restored.
+        """
+        ax._xmargin, ax._ymargin = self.margins
+        ax.xaxis._set_autoscale_on(self.autoscale[0])
+        ax.yaxis._set_autoscale_on(self.autoscale[1])
+        ax.dataLim.set(self.data_lim)
+        ax.ignore_existing_data_limits = self.ignore_data_lim
+        ax._viewLim.set_points(self.view_lim.copy())
+        ax._stale_viewlims.update(self.stale_view_lim)
+        ax.stale = True
+
+
+class _GridState:
+    def __init__(self, grid: Grid):
+        fig = grid.fig
+        self.children = set(fig.get_children())
+        self.size = grid.size
+        self.size_inches = tuple(fig.get_size_inches())
+        self.dpi = fig.dpi
+        self.facecolor = fig.get_facecolor()
+        self.gridw = grid.gridw.copy()
+        self.gridh = grid.gridh.copy()
+        self.axs = grid._axes.copy()
+        self.ca = grid._ca
+        self.raster_policy = grid._raster_policy
+        self.axes = {ax: _AxesState(ax) for ax in fig.axes}
+
+    def restore(self, grid: Grid):
+        fig = grid.fig
+        grid.disable_profiling()
+
+        for a in fig.get_children():
+            if a not in self.children:
+                a.remove()
+
+        for name in ("_suptitle", "_supxlabel", "_supylabel"):
+            if getattr(fig, name, None) not in (None, *self.children):
+                setattr(fig, name, None)
+
+        for ax, state in self.axes.items():
+            state.restore(ax)
+
+        # all at once, as share groups span several axes
+        for ax, state in self.axes.items():
+            state.restore_limits(ax)
+
+        grid._axes[...] = self.axs
+        grid._ca = self.ca
+        grid._raster_policy = self.raster_policy
+
+        if not (
+            np.array_equal(grid.gridw, self.gridw)
+            and np.array_equal(grid.gridh, self.gridh)
+        ):
+            grid.gridw, grid.gridh = self.gridw.copy(), self.gridh.copy()
+            grid.gs.set_width_ratios(grid.gridw)
+            grid.gs.set_height_ratios(grid.gridh)
+
+            for ax in fig.axes:
+                ax.set_subplotspec(ax.get_subplotspec())
+
+        grid.size = self.size
+        fig.set_size_inches(self.size_inches)
+        fig.set_dpi(self.dpi)
+        fig.set_facecolor(self.facecolor)
+
+
+class GridPool:
+    """Pool of Grids sharing the same layout, reused across renders.
+
+    Grids are built on demand with ``Grid(*args, **kwargs)``. On release, all
+    artists and axes added since the grid was built are removed, and the
+    limits, color cycles, scales, tickers, tick parameters, titles, labels,
+    spines and figure size are restored to their initial state.
+
+    Parameters
+    ----------
+    *args, **kwargs
+        Passed to ``Grid``, e.g. ``pyplot=False`` for server use.
+    maxsize : int, optional
+        Maximum number of idle grids kept. Extra released grids are closed.
+    """
+
+    def __init__(self, *args, maxsize=None, **kwargs):
+        self._args = args
+        self._kwargs = kwargs
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._idle = []
+        self._states = {}
+        self._acquired = set()
+
+    def acquire(self) -> Grid:
+        with self._lock:
+            if self._idle:
+                grid = self._idle.pop()
+                self._acquired.add(grid)
+                return grid
+
+        grid = Grid(*self._args, **self._kwargs)
+
+        with self._lock:
+            self._states[grid] = _GridState(grid)
+            self._acquired.add(grid)
+
+        return grid
+
+    def release(self, grid: Grid):
+        with self._lock:
+            state = self._states.get(grid)
+
+            if state is None:
+                raise ValueError("grid was not acquired from this pool")
+
+            if grid not in self._acquired:
+                raise ValueError("grid was already released")
+
+            self._acquired.remove(grid)
+
+        try:
+            state.restore(grid)
+        except Exception:
+            self._discard(grid)
+            raise
+
+        with self._lock:
+            if self.maxsize is None or len(self._idle) < self.maxsize:
+                self._idle.append(grid)
+                return
+
+        self._discard(grid)
+
+    def _discard(self, grid: Grid):
+        with self._lock:
+            self._states.pop(grid, None)
+
+        grid.close()
+
+    @contextmanager
+    def grid(self):
+        """Acquire a grid and release it on exit."""
+        grid = self.acquire()
+
+        try:
+            yield grid
+        finally:
+            self.release(grid)
+
+    def clear(self):
+        """Close all idle grids."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for grid in idle:
+            self._discard(grid)
@@ -0,0 +1,197 @@
+import time
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.collections import Collection
+from matplotlib.figure import Figure
+
+REPORT_DTYPE = np.dtype(
+    [
+        ("row", int),
+        ("col", int),
+        ("artist", object),
+        ("time", float),
+        ("calls", int),
+        ("artists", int),
+        ("vertices", int),
+        ("rasterized", bool),
+    ]
+)
+
+
+def _get_name(artist: Artist):
+    name = type(artist).__name__
+    label = Artist.get_label(artist)  # Axis.get_label returns a Text
+
+    if label and not label.startswith("_"):
+        name = f"{name} {label!r}"
+
+    return name
+
+
+def _count_vertices(artist: Artist):
+    if isinstance(artist, Collection):
+        paths = artist.get_paths()
+        n = sum(len(p.vertices) for p in paths)
+
+        # a single path (e.g. a marker) is drawn at every offset
+        return n * max(len(artist.get_offsets()), 1) if len(paths) == 1 else n
+
+    get_path = getattr(artist, "get_path", None)
+
+    if get_path is None:
+        return 0
+
+    try:
+        return len(get_path().vertices)
+    except Exception:
+        return 0
+
+
+class DrawProfiler:
+    """Time the draw of each axes of a figure and of each of their artists.
+
+    The figure draw is wrapped; only every ``every``-th draw is profiled, by
+    temporarily wrapping the draw of each axes and of its children. Other
+    draws only pay for a counter increment.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+    axes : np.ndarray, optional
+        2D object array of axes (or None) used to key the report by grid
+        position. Other axes are reported at (-1, -1).
+    every : int
+        Profile one draw out of ``every``.
+    """
+
+    def __init__(self, fig: Figure, axes=None, every=1):
+        self.fig = fig
+        self.axes = axes
+        self.every = every
+        self.n_draws = 0
+        self.n_sampled = 0
+        self._stats = {}
+        fig.draw = self._draw
+
+    def close(self):
+        """Stop profiling and restore the figure draw."""
+        if vars(self.fig).get("draw") == self._draw:
+            del self.fig.draw
+
+    def reset(self):
+        self.n_draws = self.n_sampled = 0
+        self._stats.clear()
+
+    def _get_positions(self):
+        if self.axes is None:
+            return {}
+
+        return {ax: ij for ij, ax in np.ndenumerate(self.axes) if ax is not None}
+
+    def _draw(self, renderer):
+        self.n_draws += 1
+
+        if (self.n_draws - 1) % self.every:
+            return type(self.fig).draw(self.fig, renderer)
+
+        positions = self._get_positions()
+        wrapped = []
+
+        try:
+            # keys only depend on the layout, so that artists recreated at
+            # every render accumulate into the same rows
+            for k, ax in enumerate(self.fig.axes):
+                i, j = positions.get(ax, (-1, -1))
+                key = i, j, k if (i, j) == (-1, -1) else -1
+                children = ax.get_children()
+                wrapped.append(self._wrap(ax, key, len(children)))
+                wrapped.extend(
+                    self._wrap(a, (*key, n, _get_name(a)))
+                    for n, a in enumerate(children)
+                )
+
+            return type(self.fig).draw(self.fig, renderer)
+        finally:
+            for artist, draw in wrapped:
+                if draw is None:
+                    del artist.draw
+                else:
+                    artist.draw = draw
+
+            self.n_sampled += 1
+
+    def _wrap(self, artist: Artist, key, n_artists=1):
+        previous = vars(artist).get("draw")
+        draw = artist.draw
+
+        def wrapper(renderer, *args, **kwargs):
+            t = time.perf_counter()
+
+            try:
+                return draw(renderer, *args, **kwargs)
+            finally:
+                dt = time.perf_counter() - t
+                stats = self._stats.get(key)
+
+                if stats is None:
+                    stats = self._stats[key] = [_get_name(artist), 0.0, 0, 0, 0, False]
+
+                stats[1] += dt
+                stats[2] += 1
+                stats[3] = n_artists
+                stats[4] = 0 if n_artists > 1 else _count_vertices(artist)
+                stats[5] = bool(artist.get_rasterized())
+
+        artist.draw = wrapper
+        return artist, previous
+
+    def report(self, sort="time"):
+        """Get the profiled draws as a structured array.
+
+        One row per axes (its time includes its artists, ``artists`` is its
+        number of children and ``vertices`` their total) followed by one row
+        per artist. ``time`` is the total over sampled draws in seconds.
+
+        Parameters
+        ----------
+        sort : str, optional
+            Field to sort by, in descending order. None keeps draw order.
+        """
+        vertices = {}
+
+        for key, stats in self._stats.items():
+            if len(key) == 5:
+                vertices[key[:3]] = vertices.get(key[:3], 0) + stats[4]
+
+        rows = []
+
+        for key, (name, t, calls, n, v, rasterized) in self._stats.items():
+            v = vertices.get(key, v) if len(key) == 3 else v
+            rows.append((key[0], key[1], name, t, calls, n, v, rasterized))
+
+        report = np.array(rows, REPORT_DTYPE)
+
+        if sort is not None:
+            report = report[np.argsort(report[sort], kind="stable")[::-1]]
+
+        return report
+
+    def table(self, sort="time", n=20):
+        """Format the ``n`` first rows of the report as a table."""
+        report = self.report(sort)[:n]
+        lines = [
+            f"{self.n_sampled} of {self.n_draws} draws profiled",
+            f"{'pos':>9} {'artist':<32} {'time [ms]':>10} {'calls':>6} "
+            f"{'artists':>7} {'vertices':>9} {'raster':>6}",
+        ]
+
+        for r in report:
+            pos = f"({r['row']}, {r['col']})"
+            lines.append(
+                f"{pos:>9} {r['artist'][:32]:<32} {r['time'] * 1e3:>10.3f} "
+                f"{r['calls']:>6} {r['artists']:>7} {r['vertices']:>9} "
+                f"{'yes' if r['rasterized'] else 'no':>6}"
+            )
+
+        return "\n".join(lines)
@@ -0,0 +1,263 @@
+import numpy as np
+
+# same weights as mplex.colors.to_gray
+_GRAY_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+
+def get_rgba_buffer(canvas, draw=True):
+    """Get a read-only view of the RGBA buffer of an Agg canvas.
+
+    The view shares memory with the renderer of the canvas. Its content is
+    overwritten by the next draw of the canvas, and it no longer reflects the
+    canvas once the figure size or dpi changes (a new renderer is created).
+    Copy it if it has to outlive either.
+    """
+    if draw:
+        canvas.draw()
+
+    img = np.asarray(canvas.buffer_rgba()).view()
+    img.flags.writeable = False
+    return img
+
+
+def convert_rgba(img, mode="rgba", dtype=np.uint8, out=None):
+    """Convert a uint8 RGBA image in a single pass.
+
+    Parameters
+    ----------
+    img : np.ndarray
+        uint8 array of shape (height, width, 4).
+    mode : str
+        "rgba", "rgb" or "gray". Gray uses the same luminance weights as
+        ``mplex.colors.to_gray`` and ignores alpha.
+    dtype
+        uint8 (0-255) or a float dtype (0-1). Gray values are rounded when
+        converted to uint8.
+    out : np.ndarray, optional
+        Preallocated output of the right shape and dtype.
+
+    Returns
+    -------
+    np.ndarray
+    """
+    mode = mode.strip().lower()
+    dtype = np.dtype(dtype)
+
+    if mode not in ("rgba", "rgb", "gray", "grey"):
+        raise ValueError(f"Invalid mode: {mode}")
+
+    if dtype != np.uint8 and dtype.kind != "f":
+        raise ValueError(f"Invalid dtype: {dtype}")
+
+    gray = mode in ("gray", "grey")
+    shape = img.shape[:2] if gray else img.shape[:2] + (len(mode),)
+
+    if out is None:
+        out = np.empty(shape, dtype)
+    elif out.shape != shape or out.dtype != dtype:
+        raise ValueError(
+            f"out must have shape {shape} and dtype {dtype}, "
+            f"got {out.shape} and {out.dtype}"
+        )
+
+    if gray and dtype.kind == "f":
+        np.einsum("ijk,k->ij", img[..., :3], _GRAY_WEIGHTS / 255, out=out)
+    elif gray:
+        # round rather than truncate, e.g. white would become 254
+        values = np.einsum("ijk,k->ij", img[..., :3], _GRAY_WEIGHTS)
+        np.rint(values, out=out, casting="unsafe")
+    elif dtype.kind == "f":
+        np.multiply(img[..., : len(mode)], dtype.type(1 / 255), out=out)
+    else:
+        np.copyto(out, img[..., : len(mode)])
+
+    return out
+
+
+def _get_pixel_box(bbox, height, margin):
+    """Rows and columns (r0, r1, c0, c1) of the buffer covered by a display bbox."""
+    return (
+        max(int(np.floor(height - bbox.y1)) - margin, 0),
+        max(int(np.ceil(height - bbox.y0)) + margin, 0),
+        max(int(np.floor(bbox.x0)) - margin, 0),
+        max(int(np.ceil(bbox.x1)) + margin, 0),
+    )
+
+
+def _intersects(a, b):
+    return a[0] < b[1] and b[0] < a[1] and a[2] < b[3] and b[2] < a[3]
+
+
+class IncrementalDraw:
+    """Redraw only the regions of the axes that changed since the last draw.
+
+    Axes are dirty when stale, i.e. when an artist was added or removed or
+    their limits or data changed. Their regions (the union of the tight
+    bounding boxes before and after the change) are cleared and redrawn with
+    every axes overlapping them, then pasted into the previous buffer, which
+    gives the same pixels as a full draw. A full draw is done the first time,
+    when the figure size or dpi changed, when axes were added or removed,
+    when an artist of the figure itself changed, when the regions overlap all
+    axes (e.g. after changing the limits of axes shared by all), or when the
+    figure was drawn by something else (e.g. ``savefig``) in between.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure with an Agg canvas.
+    margin : int
+        Pixels added around each region for antialiasing.
+    """
+
+    def __init__(self, fig, margin=2):
+        self.fig = fig
+        self.margin = margin
+        self._renderer = None
+        self._boxes = {}
+        self._drawing = False
+        self._cid = fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def close(self):
+        self.fig.canvas.mpl_disconnect(self._cid)
+        self._renderer = None
+
+    def _on_draw(self, event):
+        if not self._drawing:
+            self._renderer = None
+
+    def _get_box(self, ax, renderer, height):
+        # measuring updates the title and spines, which marks the axes stale
+        stale = ax.stale
+
+        try:
+            return self._measure(ax, renderer, height)
+        finally:
+            ax.stale = stale
+
+    def _measure(self, ax, renderer, height):
+        from matplotlib.collections import Collection
+        from matplotlib.lines import Line2D
+        from matplotlib.patches import Patch
+
+        bbox = ax.get_tightbbox(renderer) if ax.get_visible() else None
+
+        if bbox is None:
+            return None
+
+        lw = 0
+
+        for a in ax.get_children():
+            if not isinstance(a, (Collection, Line2D, Patch)):
+                continue
+
+            # extents do not include the strokes
+            lw = max(lw, np.max(a.get_linewidth(), initial=0))
+
+            # e.g. scatter markers, whose extent is unknown
+            if not a.get_clip_on() and a.get_visible():
+                if not np.isfinite(a.get_window_extent(renderer).extents).all():
+                    return 0, height, 0, int(np.ceil(renderer.width))
+
+        margin = self.margin + int(np.ceil(renderer.points_to_pixels(lw) / 2))
+        return _get_pixel_box(bbox, height, margin)
+
+    def _full_draw(self):
+        canvas = self.fig.canvas
+        self._drawing = True
+
+        try:
+            canvas.draw()
+        finally:
+            self._drawing = False
+
+        self._renderer = renderer = canvas.get_renderer()
+        self._boxes = {
+            ax: self._get_box(ax, renderer, renderer.height) for ax in self.fig.axes
+        }
+
+    def draw(self):
+        """Update the canvas buffer.
+
+        Returns
+        -------
+        list of tuple or None
+            Redrawn regions as (r0, r1, c0, c1) rows and columns of the
+            buffer, or None after a full draw.
+        """
+        fig = self.fig
+        renderer = fig.canvas.get_renderer()
+        axes = fig.axes
+        children = [a for a in fig.get_children() if a not in self._boxes]
+
+        if (
+            renderer is not self._renderer
+            or len(axes) != len(self._boxes)
+            or any(ax not in self._boxes for ax in axes)
+            or any(a.stale for a in children)
+        ):
+            self._full_draw()
+            return None
+
+        # pending autoscaling may change the limits of shared axes
+        for ax in axes:
+            ax._unstale_viewLim()
+
+        dirty = [ax for ax in axes if ax.stale]
+
+        if not dirty:
+            fig.stale = False
+            return []
+
+        height = renderer.height
+        regions = [self._boxes[ax] for ax in dirty if self._boxes[ax] is not None]
+        new = {ax: self._get_box(ax, renderer, height) for ax in dirty}
+        regions += [box for box in new.values() if box is not None]
+        regions = list(dict.fromkeys(regions))
+        hidden = [
+            ax
+            for ax, box in self._boxes.items()
+            if ax not in new
+            and (box is None or not any(_intersects(box, r) for r in regions))
+        ]
+
+        if not hidden:
+            self._full_draw()
+            return None
+
+        buf = np.asarray(renderer.buffer_rgba())
+        previous = buf.copy()
+        animated = [ax.get_animated() for ax in hidden]
+        self._drawing = True
+
+        try:
+            for ax in hidden:
+                ax.set_animated(True)
+
+            renderer.clear()
+            fig.draw(renderer)
+        finally:
+            # Figure.draw applies the aspect of all axes, marking them stale
+            for ax, b in zip(hidden, animated):
+                ax.set_animated(b)
+                ax.stale = False
+
+            self._drawing = False
+
+        # limits may only be final after the draw (e.g. deferred tight bounds)
+        for ax in dirty:
+            box = self._get_box(ax, renderer, height)
+
+            if box is not None and not any(
+                r[0] <= box[0] and box[1] <= r[1] and r[2] <= box[2] and box[3] <= r[3]
+                for r in regions
+            ):
+                self._full_draw()
+                return None
+
+            self._boxes[ax] = box
+
+        for r0, r1, c0, c1 in regions:
+            previous[r0:r1, c0:c1] = buf[r0:r1, c0:c1]
+
+        buf[...] = previous
+        return regions
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import matplotlib.style
 
 
 def get_style(style="default"):
@@ -25,4 +25,4 @@ def use_style(style="default"):
 
     mathtext.FontConstantsBase.sup1 = 0.35
 
-    plt.style.use(get_style(style))
+    matplotlib.style.use(get_style(style))
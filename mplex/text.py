@@ -1,4 +1,8 @@
-import matplotlib.pyplot as plt
+import threading
+from collections import OrderedDict
+
+import matplotlib
+import numpy as np
 
 from mplex import core
 
@@ -16,13 +20,13 @@ def add_text(
     ax=None,
     **kwargs,
 ):
-    import matplotlib.pyplot as plt
-
     from mplex.utils import safe_unpack
 
     pad = safe_unpack(pad)
 
     if ax is None:
+        import matplotlib.pyplot as plt
+
         ax = plt.gca()
 
     if isinstance(transform, str):
@@ -56,13 +60,15 @@ def set_text_outline(text, lw=2, c="w", **kwargs):
 
 def get_text_bbox(text, ax=None, **kwargs):
     if ax is None:
+        import matplotlib.pyplot as plt
+
         ax = plt.gca()
 
     remove = False
     kwargs = dict(dict(x=0, y=0), **kwargs)
     r = ax.figure.canvas.get_renderer()
     if isinstance(text, str):
-        text = ax.text(text, **kwargs)
+        text = ax.text(s=text, **kwargs)
         remove = True
     bb = text.get_window_extent(renderer=r)
     if remove:
@@ -73,3 +79,100 @@ def get_text_bbox(text, ax=None, **kwargs):
 def get_text_size(text, ax=None, **kwargs):
     bb = get_text_bbox(text, ax=ax, **kwargs)
     return bb.width, bb.height
+
+
+class TextMetrics:
+    """Measure text extents without adding artists to a figure.
+
+    Extents are cached by string, font properties, rotation, line spacing and
+    dpi, in a bounded LRU cache.
+    """
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._renderers = {}
+        self._lock = threading.Lock()
+
+    def _get_text(self, dpi, props):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from matplotlib.text import Text
+
+        if dpi not in self._renderers:
+            canvas = FigureCanvasAgg(Figure(dpi=dpi))
+            self._renderers[dpi] = canvas.figure, canvas.get_renderer()
+
+        fig, renderer = self._renderers[dpi]
+        text = Text(0, 0, "", **props)
+        text.set_figure(fig)
+        return text, renderer
+
+    def measure(self, strings, dpi=None, **props):
+        """Get the sizes of strings rendered with the same text properties.
+
+        Parameters
+        ----------
+        strings : sequence of str
+        dpi : float, optional
+            Defaults to ``rcParams["figure.dpi"]``. At 72 dpi, sizes are in
+            points.
+        **props
+            Text properties, e.g. size, family, weight, rotation, linespacing.
+
+        Returns
+        -------
+        np.ndarray
+            Widths and heights in pixels, of shape (len(strings), 2).
+        """
+        if dpi is None:
+            dpi = matplotlib.rcParams["figure.dpi"]
+
+        sizes = np.zeros((len(strings), 2))
+
+        with self._lock:
+            text, renderer = self._get_text(dpi, props)
+            base_key = (
+                text.get_fontproperties().copy(),
+                text.get_rotation(),
+                text.get_linespacing(),
+                text.get_usetex(),
+                dpi,
+            )
+
+            for i, s in enumerate(strings):
+                if not s:
+                    continue
+
+                key = s, base_key
+                size = self._cache.get(key)
+
+                if size is None:
+                    text.set_text(s)
+                    bb = text.get_window_extent(renderer)
+                    size = self._cache[key] = bb.width, bb.height
+
+                    if len(self._cache) > self.maxsize:
+                        self._cache.popitem(last=False)
+                else:
+                    self._cache.move_to_end(key)
+
+                sizes[i] = size
+
+        return sizes
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._renderers.clear()
+
+
+text_metrics = TextMetrics()
+
+
+def measure(strings, dpi=None, **props):
+    """Measure strings with the shared ``TextMetrics`` cache.
+
+    See ``TextMetrics.measure``.
+    """
+    return text_metrics.measure(strings, dpi, **props)
@@ -1,4 +1,4 @@
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 
 from mplex.utils import convert_unit
 
@@ -6,13 +6,15 @@ from mplex.utils import convert_unit
 def get_shifted_trans_axes(
     dx=0,
     dy=0,
-    ax: plt.Axes = None,
+    ax: Axes = None,
     unit="pt",
     transform="axes",
 ):
     from matplotlib.transforms import ScaledTranslation
 
     if ax is None:
+        import matplotlib.pyplot as plt
+
         ax = plt.gca()
 
     dx, dy = convert_unit((dx, dy), fro=unit, to="inch")
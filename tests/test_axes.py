@@ -0,0 +1,49 @@
+import gc
+import weakref
+
+import matplotlib
+
+from mplex import Grid
+
+
+def _is_collected(make_grid):
+    grid = make_grid()
+    ref = weakref.ref(grid.fig)
+    grid.close()
+    del grid
+    gc.collect()
+    return ref() is None
+
+
+def test_cached_ticks_do_not_keep_figure_alive():
+    def make_grid():
+        grid = Grid(40, (2, 2), pyplot=False, cache_ticks=True)
+        grid[:].plot([1, 2, 3])
+        grid.to_rgba_array()
+        return grid
+
+    assert _is_collected(make_grid)
+
+
+def test_cached_labels_follow_rcparams():
+    with matplotlib.rc_context({"axes.unicode_minus": False}):
+        grid = Grid(40, pyplot=False, cache_ticks=True)
+        grid[0, 0].plot([-5, 5])
+        grid.to_rgba_array()
+        matplotlib.rcParams["axes.unicode_minus"] = True
+        grid.to_rgba_array()
+        labels = [t.get_text() for t in grid[0, 0].get_yticklabels()]
+        grid.close()
+
+    assert "\N{MINUS SIGN}5" in labels
+
+
+def test_tight_bounds_do_not_keep_figure_alive():
+    def make_grid():
+        grid = Grid(40, (2, 2), pyplot=False, cache_ticks=False)
+        grid[:].plot([1, 2, 3])
+        grid[:].set_tight_bounds()
+        grid.to_rgba_array()
+        return grid
+
+    assert _is_collected(make_grid)
@@ -0,0 +1,10 @@
+from mplex import Grid
+
+
+def test_broadcast_without_collecting():
+    grid = Grid(10, (2, 3), pyplot=False)
+    assert grid[:].broadcast("set_xlim", 0, 2, collect=False) is None
+    assert grid[:].set_ylim(0, 3, collect=False) is None
+    assert grid[:].get_xlim().shape == (2, 3, 2)
+    assert all(ax.get_ylim() == (0, 3) for ax in grid.axs.flat)
+    grid.close()
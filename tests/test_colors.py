@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from mplex import cm, colors
+
+PAIRS = [("k", "w"), ("r", "b"), ("tab:orange", "tab:cyan"), ("#123456", "y")]
+
+
+def _colormath_lerp(c1, c2, n, color_space):
+    """Former colormath implementation of ``lerp_colors``."""
+    from colormath.color_conversions import convert_color
+    from colormath.color_objects import LabColor, LuvColor, sRGBColor
+    from matplotlib.colors import to_rgb
+
+    color_space = dict(lab=LabColor, luv=LuvColor)[color_space]
+    c1 = convert_color(sRGBColor(*to_rgb(c1)), color_space)
+    c2 = convert_color(sRGBColor(*to_rgb(c2)), color_space)
+    values = np.linspace(c1.get_value_tuple(), c2.get_value_tuple(), n)
+    rgb = [convert_color(color_space(*v), sRGBColor).get_value_tuple() for v in values]
+    return np.clip(rgb, 0, 1)
+
+
+@pytest.mark.parametrize("color_space", ["lab", "luv"])
+@pytest.mark.parametrize("c1, c2", PAIRS)
+def test_lerp_colors_matches_colormath(c1, c2, color_space):
+    pytest.importorskip("colormath")
+    expected = _colormath_lerp(c1, c2, 64, color_space)
+    actual = cm.lerp_colors(c1, c2, 64, as_cmap=False, color_space=color_space)
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("color_space", ["lab", "luv"])
+def test_rgb_conversion_matches_colormath(color_space):
+    pytest.importorskip("colormath")
+    from colormath.color_conversions import convert_color
+    from colormath.color_objects import LabColor, LuvColor, sRGBColor
+
+    rgb = np.random.default_rng(0).random((32, 3))
+    cls = dict(lab=LabColor, luv=LuvColor)[color_space]
+    expected = [convert_color(sRGBColor(*c), cls).get_value_tuple() for c in rgb]
+    to_space = dict(lab=colors.rgb_to_lab, luv=colors.rgb_to_luv)[color_space]
+    np.testing.assert_allclose(to_space(rgb), expected, rtol=0, atol=1e-10)
@@ -0,0 +1,8 @@
+from mplex import Grid
+
+
+def test_private_lookup_does_not_build_lazy_axes():
+    grid = Grid(10, (4, 6), lazy=True, pyplot=False)
+    assert not hasattr(grid, "_repr_png_")
+    assert all(ax is None for ax in grid._axes.flat)
+    grid.close()
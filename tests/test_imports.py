@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+# `import mplex` may cost at most this much more than `import matplotlib`;
+# importing pyplot alone takes about 2.5 times as long as matplotlib
+IMPORT_BUDGET = 1.5
+
+
+def _import_time(module, repeat=3):
+    """Best cumulative import time of ``module`` in microseconds."""
+    times = []
+
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        lines = [line.split("|") for line in out.splitlines() if "|" in line]
+        times.append(
+            next(int(t) for _, t, name in reversed(lines) if name.strip() == module)
+        )
+
+    return min(times)
+
+
+def test_import_does_not_load_pyplot():
+    code = "import sys, mplex; print('matplotlib.pyplot' in sys.modules)"
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert out.strip() == "False"
+
+
+def test_import_time_budget():
+    mplex = _import_time("mplex")
+    matplotlib = _import_time("matplotlib")
+    assert mplex <= IMPORT_BUDGET * matplotlib, (mplex, matplotlib)
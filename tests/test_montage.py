@@ -0,0 +1,24 @@
+import numpy as np
+
+from mplex import Grid
+
+
+def test_set_images_matches_imshow():
+    # sizes chosen so that no cell edge falls exactly between two pixels
+    rng = np.random.default_rng(0)
+    images = [rng.random((8, 8)) for _ in range(9)]
+    images[0][0, 0], images[-1][-1, -1] = 0, 1
+
+    ref = Grid(41, (3, 3), space=5.3, sharex="n", sharey="n", pyplot=False)
+
+    for ax, img in zip(ref.axs.flat, images):
+        ax.imshow(img, "gray", vmin=0, vmax=1, interpolation="nearest", aspect="auto")
+        ax.axis("off")
+
+    grid = Grid(41, (3, 3), space=5.3, lazy=True, pyplot=False)
+    montage = grid.montage(images[::-1])
+    montage.set_images(images)
+
+    np.testing.assert_array_equal(grid.to_rgba_array(), ref.to_rgba_array())
+    ref.close()
+    grid.close()
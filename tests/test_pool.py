@@ -0,0 +1,34 @@
+import numpy as np
+
+from mplex import Grid
+from mplex.pool import GridPool
+
+
+def _plot(grid):
+    grid[0, 1].plot([1, 3])
+    grid[1, 0].scatter([2], [7])
+
+
+def test_reused_grid_renders_like_a_fresh_one():
+    pool = GridPool(40, (2, 2), pyplot=False)
+    grid = pool.acquire()
+    grid[0, 0].plot([5, 6])
+    grid[1, 1].set_xscale("log")
+    grid.to_rgba_array()
+    pool.release(grid)
+
+    # drawn untouched, then released
+    assert pool.acquire() is grid
+    grid.to_rgba_array()
+    pool.release(grid)
+
+    fresh = Grid(40, (2, 2), pyplot=False)
+    assert pool.acquire() is grid
+    np.testing.assert_array_equal(grid.to_rgba_array(), fresh.to_rgba_array())
+
+    _plot(grid)
+    _plot(fresh)
+    np.testing.assert_array_equal(grid.to_rgba_array(), fresh.to_rgba_array())
+    pool.release(grid)
+    pool.clear()
+    fresh.close()